@@ -7,16 +7,20 @@ You can define an instance of each data loader class through a link:https://docs
 Requires `querywriters` user permissions for full functionality. 
 """
 
+import ctypes
 import io
 import logging
 import math
 import os
-from collections import defaultdict
-from queue import Empty, Queue
-from threading import Event, Thread
-from time import sleep
-from typing import (TYPE_CHECKING, Any, Iterator, NoReturn, Tuple,
-                    Union)
+import warnings
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from queue import Empty, Full, Queue
+from threading import Barrier, BrokenBarrierError, Condition, Event, Lock, Thread
+from time import monotonic, sleep
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterator, NoReturn,
+                    Tuple, Union)
 
 if TYPE_CHECKING:
     from ..pyTigerGraph import TigerGraphConnection
@@ -33,11 +37,173 @@ import numpy as np
 import pandas as pd
 
 from ..pyTigerGraphException import TigerGraphException
-from .utilities import install_query_file, random_string
+from .kernels import parse_int_csv, parse_numeric_csv
+from .utilities import forget_installed_query, install_query_file, random_string
 
 __all__ = ["VertexLoader", "EdgeLoader", "NeighborLoader", "GraphLoader", "EdgeNeighborLoader"]
 
 RANDOM_TOPIC_LEN = 8
+# Attribute types that are written to the CSV batches as plain integers.
+INT_ATTR_TYPES = frozenset(("INT", "UINT", "BOOL"))
+# Python packages kafka-python needs to decompress each compression type.
+KAFKA_CODEC_PACKAGES = {"snappy": "python-snappy", "lz4": "lz4", "zstd": "zstandard"}
+# Attribute types the CSV reader can parse into numbers directly. Booleans are
+# written as 0 or 1 and become bool arrays without going through strings.
+CSV_NUMERIC_DTYPES = {
+    "INT": "int64", "UINT": "uint64", "FLOAT": "float64", "DOUBLE": "float64", "BOOL": "int8"
+}
+
+
+class _BatchQueue:
+    """NO DOC: FIFO queue for handing batches between the loader threads.
+
+    Works as a drop-in for the parts of `queue.Queue` used by the loaders.
+    `put` and `get` go straight to a `deque` (atomic under the GIL) and only
+    take the lock when they have to wait, or to wake up a waiting thread.
+    `maxsize` is a soft bound: with several producers it can be exceeded
+    by at most one item per producer.
+    """
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._items = deque()
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+        self._getters = 0
+        self._putters = 0
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def put(self, item: Any, block: bool = True, timeout: float = None) -> None:
+        if 0 < self.maxsize <= len(self._items):
+            if not block:
+                raise Full
+            with self._lock:
+                self._putters += 1
+                try:
+                    deadline = None if timeout is None else monotonic() + timeout
+                    while self.full():
+                        self._wait(self._not_full, deadline, Full)
+                finally:
+                    self._putters -= 1
+        self._items.append(item)
+        if self._getters:
+            with self._lock:
+                self._not_empty.notify()
+
+    def put_many(self, items: list, block: bool = True, timeout: float = None) -> None:
+        """Put several items with a single wait and wake-up.
+
+        Waits while the queue is full, then adds all items, which may take the
+        queue past `maxsize` by the number of items.
+        """
+        if not items:
+            return
+        if 0 < self.maxsize <= len(self._items):
+            if not block:
+                raise Full
+            with self._lock:
+                self._putters += 1
+                try:
+                    deadline = None if timeout is None else monotonic() + timeout
+                    while self.full():
+                        self._wait(self._not_full, deadline, Full)
+                finally:
+                    self._putters -= 1
+        self._items.extend(items)
+        if self._getters:
+            with self._lock:
+                self._not_empty.notify(len(items))
+
+    def get(self, block: bool = True, timeout: float = None) -> Any:
+        try:
+            item = self._items.popleft()
+        except IndexError:
+            if not block:
+                raise Empty
+            with self._lock:
+                # The waiter is counted before checking again, so an item
+                # put after this point always notifies us.
+                self._getters += 1
+                try:
+                    deadline = None if timeout is None else monotonic() + timeout
+                    while True:
+                        try:
+                            item = self._items.popleft()
+                            break
+                        except IndexError:
+                            self._wait(self._not_empty, deadline, Empty)
+                finally:
+                    self._getters -= 1
+        if self._putters:
+            with self._lock:
+                self._not_full.notify()
+        return item
+
+    def task_done(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        """Drop all items at once and wake up any blocked producers."""
+        with self._lock:
+            self._items.clear()
+            self._not_full.notify_all()
+
+    @staticmethod
+    def _wait(cond: Condition, deadline: float, exc: type) -> None:
+        if deadline is None:
+            cond.wait()
+            return
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            raise exc
+        cond.wait(remaining)
+
+
+class _InlineThread:
+    """NO DOC: Stand-in for a `Thread` that runs its target on the calling thread
+    when started.
+    """
+    def __init__(self, target, args: tuple = (), kwargs: dict = None) -> None:
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs or {}
+
+    def start(self) -> None:
+        self._target(*self._args, **self._kwargs)
+
+    def join(self, timeout: float = None) -> None:
+        pass
+
+    def is_alive(self) -> bool:
+        return False
+
+
+class _ThreadFailure:
+    """NO DOC: Put on the output queue by a loader thread that failed, so that
+    the consumer raises its error instead of waiting for data forever.
+    """
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+class _DownloadState:
+    """NO DOC: Progress shared by the Kafka downloader threads of a loader."""
+    def __init__(self, num_downloaders: int = 1) -> None:
+        self.lock = Lock()
+        self.delivered = 0
+        self.running = num_downloaders
+        # Halves of batches waiting for their companion, keyed by batch ID.
+        # They can arrive on different partitions, i.e., different threads.
+        self.vertex_buf = {}
+        self.edge_buf = {}
 
 
 class BaseLoader:
@@ -51,6 +217,9 @@ class BaseLoader:
         output_format: str = "dataframe",
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
         kafka_address: str = "",
         Kafka_max_msg_size: int = 104857600,
         kafka_num_partitions: int = 1,
@@ -68,7 +237,13 @@ class BaseLoader:
         kafka_skip_produce: bool = False,
         kafka_auto_offset_reset: str = "earliest",
         kafka_del_topic_per_epoch: bool = False,
-        kafka_add_topic_per_epoch: bool = False
+        kafka_add_topic_per_epoch: bool = False,
+        kafka_fetch_min_bytes: int = 1,
+        kafka_max_poll_records: int = 500,
+        kafka_topic_compression_type: str = None,
+        kafka_fetch_max_wait_ms: int = 200,
+        kafka_fetch_max_bytes: int = None,
+        kafka_max_partition_fetch_bytes: int = None
     ) -> None:
         """Base Class for data loaders.
 
@@ -100,13 +275,26 @@ class BaseLoader:
                 Whether to traverse along reverse edge types. Defaults to False.
             timeout (int, optional):
                 Timeout value for GSQL queries, in ms. Defaults to 300000.
+            reader_threads (int, optional):
+                Number of threads parsing raw data into the output format. Batches
+                may come out of order with more than one thread. Defaults to 1.
+            numa_node (int, optional):
+                NUMA node to pin the loader's threads to, so that they and the memory
+                they allocate stay on one socket. Only supported on Linux. Defaults to
+                None (no pinning).
+            prefetch_depth (int, optional):
+                Number of upcoming epochs to request in the background when data is loaded
+                through the REST API, so that the next epoch's query runs while the current
+                one is consumed. Each prefetched epoch is held in memory until it is used.
+                Defaults to 0 (no prefetching).
             kafka_address (str):
                 Address of the Kafka broker. Defaults to localhost:9092.
             kafka_max_msg_size (int, optional):
                 Maximum size of a Kafka message in bytes.
                 Defaults to 104857600.
             kafka_num_partitions (int, optional):
-                Number of partitions for the topic created by this loader.
+                Number of partitions for the topic created by this loader. With more
+                than one, each partition is downloaded by its own consumer thread.
                 Defaults to 1.
             kafka_replica_factor (int, optional):
                 Number of replications for the topic created by this loader.
@@ -146,14 +334,40 @@ class BaseLoader:
                 `kafka_add_topic_per_epoch` is True. Defaults to False.
             kafka_add_topic_per_epoch (bool, optional):  
                 Whether to add a topic for each epoch. Defaults to False.
+            kafka_fetch_min_bytes (int, optional):
+                Minimum amount of data in bytes the broker should return for a fetch
+                request. Raising it makes the consumer wait for more batches per
+                round trip. Defaults to 1.
+            kafka_max_poll_records (int, optional):
+                Maximum number of messages returned by a single poll of the consumer.
+                Defaults to 500.
+            kafka_topic_compression_type (str, optional):
+                Compression type of the topic created by this loader, e.g., "zstd",
+                "lz4", "snappy" or "gzip". The CSV batches compress well, and "zstd"
+                usually gives the smallest transfers. The consumer needs the matching
+                Python package (`zstandard`, `lz4` or `python-snappy`) to decompress
+                messages. Note that `kafka_max_msg_size` limits the compressed size.
+                The loader queries send each batch as a single message through the
+                `write_to_kafka` UDF, so producer batching (`linger.ms`, `batch.size`)
+                has nothing to combine, and the topic is where compression is set.
+                Defaults to None, which keeps the broker default.
+            kafka_fetch_max_wait_ms (int, optional):
+                Longest time in milliseconds the broker waits for `kafka_fetch_min_bytes` of
+                data before answering a fetch. Lower values return the first batches sooner
+                while the query is still producing them. Defaults to 200.
+            kafka_fetch_max_bytes (int, optional):
+                Maximum amount of data in bytes the broker returns for one fetch request
+                across all partitions. A batch larger than this is still returned on its own.
+                Defaults to None, which uses `kafka_max_msg_size`.
+            kafka_max_partition_fetch_bytes (int, optional):
+                Maximum amount of data in bytes the broker returns per partition for one
+                fetch request. Defaults to None, which uses `kafka_max_msg_size`.
         """
         # Thread to send requests, download and load data
         self._requester = None
-        self._downloader = None
-        self._reader = None
-        # Queues to store tasks and data
-        self._request_task_q = None
-        self._download_task_q = None
+        self._downloaders = []
+        self._readers = []
+        # Queues to store raw batches and parsed data
         self._read_task_q = None
         self._data_q = None
         self._kafka_topic = None
@@ -162,12 +376,21 @@ class BaseLoader:
         self._exit_event = None
         # In-memory data cache. Only used if num_batches=1
         self._data = None
+        # Run the pipeline on the calling thread instead of starting threads
+        self._inline = False
+        # Responses of REST queries requested ahead of the epochs that use them
+        self._rest_pool = None
+        self._rest_responses = deque()
+        # Whether the query was checked again after it failed to run
+        self._query_rechecked = False
         # Kafka topic configs
         self._kafka_admin = None
         self._kafka_consumer = None
+        self._kafka_consumers = []
         self.kafka_partitions = kafka_num_partitions
         self.kafka_replica = kafka_replica_factor
         self.kafka_retention_ms = kafka_retention_ms
+        self.kafka_topic_compression_type = kafka_topic_compression_type
         self.delete_all_topics = kafka_auto_del_topic
         self.kafka_skip_produce = kafka_skip_produce
         self.add_epoch_topic = kafka_add_topic_per_epoch
@@ -179,15 +402,29 @@ class BaseLoader:
         self.reverse_edge = reverse_edge
         self._graph = graph
         self._v_schema, self._e_schema = self._get_schema()
+        # Attribute types to use when vertex or edge types are ignored.
+        self._homo_v_schema = next(iter(self._v_schema.values()), {})
+        self._homo_e_schema = next(iter(self._e_schema.values()), {})
+        # Attributes allowed for each type, for validating user input
+        self._v_allow = {k: frozenset(v) for k, v in self._v_schema.items()}
+        self._e_allow = {k: frozenset(v) for k, v in self._e_schema.items()}
+        # Attributes shared by all types. Homogeneous input is checked against
+        # these at once, and the types are only walked to report what is missing.
+        self._v_common = self._common_attributes(self._v_allow)
+        self._e_common = self._common_attributes(self._e_allow)
         # Initialize basic params
         if not loader_id:
             self.loader_id = random_string(RANDOM_TOPIC_LEN)
         else:
             self.loader_id = loader_id
+        self._payload = {}
         self.num_batches = num_batches
         self.output_format = output_format
         self.buffer_size = buffer_size
         self.timeout = timeout
+        self.reader_threads = reader_threads
+        self._cpu_affinity = self._numa_cpus(numa_node) if numa_node is not None else None
+        self.prefetch_depth = prefetch_depth
         self._iterations = 0
         self._iterator = False
         # Kafka consumer and admin
@@ -200,24 +437,42 @@ class BaseLoader:
         )
         if self.kafka_address_consumer:
             try:
-                from kafka import KafkaAdminClient, KafkaConsumer
+                from kafka import KafkaAdminClient, KafkaConsumer, codec
             except ImportError:
                 raise ImportError(
                     "kafka-python is not installed. Please install it to use kafka streaming."
                 )
-            try:
-                self._kafka_consumer = KafkaConsumer(
-                    bootstrap_servers=self.kafka_address_consumer,
-                    client_id=self.loader_id,
-                    max_partition_fetch_bytes=Kafka_max_msg_size,
-                    fetch_max_bytes=Kafka_max_msg_size,
-                    auto_offset_reset=kafka_auto_offset_reset,
-                    security_protocol=kafka_security_protocol,
-                    sasl_mechanism=kafka_sasl_mechanism,
-                    sasl_plain_username=kafka_sasl_plain_username,
-                    sasl_plain_password=kafka_sasl_plain_password,
-                    ssl_cafile=kafka_consumer_ca_location if kafka_consumer_ca_location else None
+            # Fail now rather than in the downloader thread if messages cannot be decompressed.
+            if kafka_topic_compression_type in KAFKA_CODEC_PACKAGES and \
+                not getattr(codec, "has_" + kafka_topic_compression_type)():
+                raise ImportError(
+                    "{} is not installed. Please install it to consume {} compressed topics.".format(
+                        KAFKA_CODEC_PACKAGES[kafka_topic_compression_type],
+                        kafka_topic_compression_type
+                    )
                 )
+            # Kept to create one more consumer per partition if the topic has several.
+            self._kafka_consumer_config = dict(
+                bootstrap_servers=self.kafka_address_consumer,
+                client_id=self.loader_id,
+                max_partition_fetch_bytes=kafka_max_partition_fetch_bytes or Kafka_max_msg_size,
+                fetch_max_bytes=kafka_fetch_max_bytes or Kafka_max_msg_size,
+                fetch_min_bytes=kafka_fetch_min_bytes,
+                fetch_max_wait_ms=kafka_fetch_max_wait_ms,
+                max_poll_records=kafka_max_poll_records,
+                auto_offset_reset=kafka_auto_offset_reset,
+                # The consumers have no group and track their position themselves.
+                # Offsets are never committed, so there is no commit traffic to batch.
+                enable_auto_commit=False,
+                security_protocol=kafka_security_protocol,
+                sasl_mechanism=kafka_sasl_mechanism,
+                sasl_plain_username=kafka_sasl_plain_username,
+                sasl_plain_password=kafka_sasl_plain_password,
+                ssl_cafile=kafka_consumer_ca_location if kafka_consumer_ca_location else None
+            )
+            try:
+                self._kafka_consumer = KafkaConsumer(**self._kafka_consumer_config)
+                self._kafka_consumers = [self._kafka_consumer]
                 self._kafka_admin = KafkaAdminClient(
                     bootstrap_servers=self.kafka_address_consumer,
                     client_id=self.loader_id,
@@ -232,7 +487,6 @@ class BaseLoader:
                     "Cannot reach Kafka broker. Please check Kafka settings."
                 )
         # Initialize parameters for the query
-        self._payload = {}
         if self.kafka_address_producer:
             self._payload["kafka_address"] = self.kafka_address_producer
             if kafka_security_protocol == "PLAINTEXT":
@@ -262,20 +516,22 @@ class BaseLoader:
         self._reset(theend=True)
 
     def _get_schema(self) -> Tuple[dict, dict]:
+        def attr_type(attr_type: dict) -> str:
+            if attr_type["Name"] == "LIST":
+                return "LIST:" + attr_type["ValueTypeName"]
+            return attr_type["Name"]
+
         v_schema = {}
         e_schema = {}
-        schema = self._graph.getSchema(force=True)
+        # UDTs are not needed here, so skip the extra request for them.
+        schema = self._graph.getSchema(udts=False, force=True)
         # Get vertex schema
         for vtype in schema["VertexTypes"]:
             v = vtype["Name"]
-            v_schema[v] = {}
-            for attr in vtype["Attributes"]:
-                if attr["AttributeType"]["Name"] == "LIST":
-                    v_schema[v][attr["AttributeName"]] = "LIST:" + attr["AttributeType"][
-                        "ValueTypeName"
-                    ]
-                else:
-                    v_schema[v][attr["AttributeName"]] = attr["AttributeType"]["Name"]
+            v_schema[v] = {
+                attr["AttributeName"]: attr_type(attr["AttributeType"])
+                for attr in vtype["Attributes"]
+            }
             if vtype["PrimaryId"].get("PrimaryIdAsAttribute"):
                 v_schema[v][vtype["PrimaryId"]["AttributeName"]] = vtype["PrimaryId"][
                     "AttributeType"
@@ -283,17 +539,15 @@ class BaseLoader:
         # Get edge schema
         for etype in schema["EdgeTypes"]:
             e = etype["Name"]
-            e_schema[e] = {}
-            e_schema[e]["FromVertexTypeName"] = etype["FromVertexTypeName"]
-            e_schema[e]["ToVertexTypeName"] = etype["ToVertexTypeName"]
-            e_schema[e]["IsDirected"] = etype["IsDirected"]
-            for attr in etype["Attributes"]:
-                if attr["AttributeType"]["Name"] == "LIST":
-                    e_schema[e][attr["AttributeName"]] = "LIST:" + attr["AttributeType"][
-                        "ValueTypeName"
-                    ]
-                else:
-                    e_schema[e][attr["AttributeName"]] = attr["AttributeType"]["Name"]
+            e_schema[e] = {
+                "FromVertexTypeName": etype["FromVertexTypeName"],
+                "ToVertexTypeName": etype["ToVertexTypeName"],
+                "IsDirected": etype["IsDirected"],
+            }
+            e_schema[e].update(
+                (attr["AttributeName"], attr_type(attr["AttributeType"]))
+                for attr in etype["Attributes"]
+            )
             if self.reverse_edge and ("REVERSE_EDGE" in etype["Config"]):
                 re = etype["Config"]["REVERSE_EDGE"]
                 e_schema[re] = {}
@@ -319,9 +573,9 @@ class BaseLoader:
         is_hetero: bool = False
     ) -> Union[list, dict]:
         if schema_type == "vertex":
-            schema = self._v_schema
+            schema, common = self._v_allow, self._v_common
         elif schema_type == "edge":
-            schema = self._e_schema
+            schema, common = self._e_allow, self._e_common
         else:
             raise ValueError("Schema type can only be vertex or edge.")
         if not attributes:
@@ -336,17 +590,17 @@ class BaseLoader:
         if isinstance(attributes, list):
             if is_hetero:
                 raise ValueError("Input to attributes should be dict or None if you want heterogeneous graph output.")
-            for i in range(len(attributes)):
-                attributes[i] = attributes[i].strip()
+            attributes[:] = [attr.strip() for attr in attributes]
             attr_set = set(attributes)
-            for vtype in schema:
-                allowlist = set(schema[vtype].keys())
-                if attr_set - allowlist:
-                    raise ValueError(
-                        "Attributes {} are not available for {} type {}.".format(
-                            attr_set - allowlist, schema_type, vtype
+            if not attr_set <= common:
+                for vtype, allowlist in schema.items():
+                    missing = attr_set - allowlist
+                    if missing:
+                        raise ValueError(
+                            "Attributes {} are not available for {} type {}.".format(
+                                missing, schema_type, vtype
+                            )
                         )
-                    )
         elif isinstance(attributes, dict):
             if not is_hetero:
                 raise ValueError("Input to attributes should be list or None if you want homogeneous graph output.")
@@ -355,20 +609,104 @@ class BaseLoader:
                     raise ValueError(
                         "{} type {} is not available in the database.".format(schema_type, vtype)
                     )
-                for i in range(len(attributes[vtype])):
-                    attributes[vtype][i] = attributes[vtype][i].strip()
-                attr_set = set(attributes[vtype])
-                allowlist = set(schema[vtype].keys())
-                if attr_set - allowlist:
+                attributes[vtype][:] = [attr.strip() for attr in attributes[vtype]]
+                missing = set(attributes[vtype]) - schema[vtype]
+                if missing:
                     raise ValueError(
                         "Attributes {} are not available for {} type {}.".format(
-                            attr_set - allowlist, schema_type, vtype
+                            missing, schema_type, vtype
                         )
                     )
         else:
             raise ValueError("Input to attributes should be None, list, or dict.")
         return attributes
 
+    @staticmethod
+    def _common_attributes(allow: Dict[str, frozenset]) -> frozenset:
+        return frozenset.intersection(*allow.values()) if allow else frozenset()
+
+    @property
+    def num_batches(self) -> int:
+        """Number of batches per epoch.
+
+        If it is derived from `batch_size`, the data is only counted the first
+        time the number is needed, instead of when the loader is created.
+        """
+        if self._batch_size:
+            self.num_batches = self._count_batches()
+        return self._num_batches
+
+    @num_batches.setter
+    def num_batches(self, num_batches: int) -> None:
+        self._num_batches = num_batches
+        self._batch_size = None
+        self._payload["num_batches"] = num_batches
+
+    def _set_num_batches(
+        self,
+        num_batches: int,
+        batch_size: int,
+        seed_kind: 'Literal["vertex", "edge"]',
+        seed_types: list,
+        filter_by: Union[str, dict] = None
+    ) -> None:
+        """Set the number of batches, or the batch size to derive it from.
+
+        If `batch_size` is given, the seeds (vertices or edges of `seed_types`)
+        are only counted when the number of batches is first needed.
+        """
+        if not batch_size:
+            # Take the number of batches as is.
+            self.num_batches = num_batches
+            return
+        if seed_kind == "edge" and filter_by:
+            # TODO: get edge count with filter
+            raise NotImplementedError("Cannot specify batch_size and filter_by at the same time. Please use num_batches and filter_by.")
+        self._batch_size = batch_size
+        self._batch_seeds = (seed_kind, seed_types, filter_by)
+
+    def _count_batches(self) -> int:
+        """Count the batches of `self._batch_size` seeds.
+        """
+        seed_kind, seed_types, filter_by = self._batch_seeds
+        if seed_kind == "edge":
+            num_seeds = self._count_edges(seed_types)
+        else:
+            num_seeds = self._count_vertices(seed_types, filter_by)
+        return math.ceil(num_seeds / self._batch_size)
+
+    def _count_vertices(self, vtypes: list, filter_by: Union[str, dict] = None) -> int:
+        """Count the vertices of the given types.
+
+        If `filter_by` is given, only vertices with that attribute (or the attribute
+        given for their type) set are counted. There is one request per type, so the
+        types are counted in parallel.
+        """
+        def count(vtype: str) -> int:
+            if not filter_by:
+                return self._graph.getVertexCount(vtype)
+            attr = filter_by if isinstance(filter_by, str) else filter_by[vtype]
+            return self._graph.getVertexCount(vtype, where="{}!=0".format(attr))
+
+        if len(vtypes) == 1:
+            return count(vtypes[0])
+        with ThreadPoolExecutor(max_workers=min(len(vtypes), 8)) as pool:
+            return sum(pool.map(count, vtypes))
+
+    def _count_edges(self, etypes: list) -> int:
+        """Count the edges of the given types with a single request.
+
+        Types missing from the response are counted with a request of their own.
+        """
+        counts = self._graph.getEdgeCount("*")
+        if not isinstance(counts, dict):
+            # Only one edge type in the graph.
+            return counts
+        return sum(
+            counts[etype] if etype in counts else self._graph.getEdgeCount(etype)
+            for etype in etypes
+        )
+
     def _install_query(self) -> NoReturn:
         # Install the right GSQL query for the loader.
         self.query_name = ""
@@ -385,21 +723,25 @@ class BaseLoader:
         self._payload["kafka_topic"] = kafka_topic
         self._all_kafka_topics.add(kafka_topic)
         # Create topic if not exist
-        if kafka_topic not in self._kafka_admin.list_topics():
+        created = kafka_topic not in self._kafka_admin.list_topics()
+        if created:
             try:
                 from kafka.admin import NewTopic
             except ImportError:
                 raise ImportError(
                     "kafka-python is not installed. Please install it to use kafka streaming."
                 )
+            topic_configs = {
+                "retention.ms": str(self.kafka_retention_ms),
+                "max.message.bytes": str(self.max_kafka_msg_size),
+            }
+            if self.kafka_topic_compression_type:
+                topic_configs["compression.type"] = self.kafka_topic_compression_type
             new_topic = NewTopic(
                 kafka_topic,
                 self.kafka_partitions,
                 self.kafka_replica,
-                topic_configs={
-                    "retention.ms": str(self.kafka_retention_ms),
-                    "max.message.bytes": str(self.max_kafka_msg_size),
-                },
+                topic_configs=topic_configs,
             )
             resp = self._kafka_admin.create_topics([new_topic])
             if resp.to_object()["topic_errors"][0]["error_code"] != 0:
@@ -417,10 +759,51 @@ class BaseLoader:
             if self.kafka_skip_produce is None:
                 self.kafka_skip_produce = True
         # Subscribe to the topic
-        if (not self._kafka_consumer.subscription()) or kafka_topic not in self._kafka_consumer.subscription():
+        if self.kafka_partitions > 1:
+            # A topic that existed before may have any number of partitions.
+            self._assign_kafka_partitions(
+                kafka_topic, self.kafka_partitions if created else 1)
+        elif (not self._kafka_consumer.subscription()) or kafka_topic not in self._kafka_consumer.subscription():
             self._kafka_consumer.subscribe([kafka_topic])
             _ = self._kafka_consumer.topics() # Call this to refresh metadata. Or the new subscription seems to be delayed.
 
+    def _assign_kafka_partitions(
+        self, kafka_topic: str, min_partitions: int, timeout: float = 30
+    ) -> None:
+        # Give every partition of the topic its own consumer, so that they are
+        # downloaded in parallel.
+        try:
+            from kafka import KafkaConsumer, TopicPartition
+        except ImportError:
+            raise ImportError(
+                "kafka-python is not installed. Please install it to use kafka streaming."
+            )
+        # The metadata of a topic that was just created can take a while to
+        # reach the consumer. Until then it reports no partitions.
+        deadline = monotonic() + timeout
+        while True:
+            partitions = self._kafka_consumer.partitions_for_topic(kafka_topic) or set()
+            if len(partitions) >= min_partitions:
+                break
+            if monotonic() > deadline:
+                raise ConnectionError(
+                    "Kafka topic {} has {} partitions after {}s, expected at least {}.".format(
+                        kafka_topic, len(partitions), timeout, min_partitions
+                    )
+                )
+            sleep(0.1)
+            _ = self._kafka_consumer.topics() # Refresh metadata
+        partitions = sorted(partitions)
+        while len(self._kafka_consumers) < len(partitions):
+            self._kafka_consumers.append(KafkaConsumer(**self._kafka_consumer_config))
+        for consumer in self._kafka_consumers[len(partitions):]:
+            consumer.close()
+        del self._kafka_consumers[len(partitions):]
+        for consumer, partition in zip(self._kafka_consumers, partitions):
+            tp = TopicPartition(kafka_topic, partition)
+            if consumer.assignment() != {tp}:
+                consumer.assign([tp])
+
     @staticmethod
     def _request_kafka(
         exit_event: Event,
@@ -454,13 +837,16 @@ class BaseLoader:
                     "Error writing to Kafka: {}".format(resp["results"][0]["kafkaError"])
                 )
             return
-            
+        # Poll quickly at first so short queries are picked up without delay,
+        # then back off to avoid flooding the server during long ones.
+        delay = 0.05
         while not exit_event.is_set():
             status = tgraph._get(
                 tgraph.restppUrl + "/query_status", params=_stat_payload
             )
             if status[0]["status"] == "running":
-                sleep(1)
+                sleep(delay)
+                delay = min(delay * 1.5, 2.0)
                 continue
             elif status[0]["status"] == "success":
                 res = tgraph._get(
@@ -479,28 +865,48 @@ class BaseLoader:
                     )
                 )
 
+    def _run_query(self, payload: dict) -> list:
+        """Run the loader's query over REST.
+
+        The query can be dropped or disabled on the server after it was installed,
+        e.g., by a schema change. On its first failure, check it again, reinstall
+        it if needed and retry.
+        """
+        try:
+            return self._graph.runInstalledQuery(
+                self.query_name, params=payload, timeout=self.timeout, usePost=True
+            )
+        except TigerGraphException:
+            if self._query_rechecked:
+                raise
+            self._query_rechecked = True
+            forget_installed_query(self._graph, self.query_name)
+            self.query_name = self._install_query()
+        return self._graph.runInstalledQuery(
+            self.query_name, params=payload, timeout=self.timeout, usePost=True
+        )
+
     @staticmethod
     def _request_rest(
-        tgraph: "TigerGraphConnection",
-        query_name: str,
+        run_query: Callable[[dict], list],
         read_task_q: Queue,
-        timeout: int = 600000,
         payload: dict = {},
         resp_type: 'Literal["both", "vertex", "edge"]' = "both",
+        response: Future = None,
     ) -> NoReturn:
-        # Run query
-        resp = tgraph.runInstalledQuery(
-            query_name, params=payload, timeout=timeout, usePost=True
-        )
+        # Run query, unless it was already requested ahead of time
+        if response is not None:
+            resp = response.result()
+        else:
+            resp = run_query(payload)
         # Put raw data into reading queue
-        for i in resp:
-            if resp_type == "both":
-                data = (i["vertex_batch"], i["edge_batch"])
-            elif resp_type == "vertex":
-                data = i["vertex_batch"]
-            elif resp_type == "edge":
-                data = i["edge_batch"]
-            read_task_q.put(data)
+        if resp_type == "both":
+            batches = [(i["vertex_batch"], i["edge_batch"]) for i in resp]
+        elif resp_type == "vertex":
+            batches = [i["vertex_batch"] for i in resp]
+        elif resp_type == "edge":
+            batches = [i["edge_batch"] for i in resp]
+        read_task_q.put_many(batches)
         read_task_q.put(None)
 
     @staticmethod
@@ -510,45 +916,56 @@ class BaseLoader:
         num_batches: int,
         out_tuple: bool,
         kafka_consumer: "KafkaConsumer",
+        state: _DownloadState = None,
     ) -> NoReturn:
-        delivered_batch = 0
-        buffer = {}
+        # `state` is shared when several threads download different partitions.
+        if state is None:
+            state = _DownloadState()
         while not exit_event.is_set():
-            if delivered_batch == num_batches:
+            if state.delivered == num_batches:
                 break
             resp = kafka_consumer.poll(1000)
             if not resp:
                 continue
+            # Hand the complete batches of the whole poll to the readers at once.
+            batches = []
             for msgs in resp.values():
                 for message in msgs:
-                    key = message.key.decode("utf-8")
                     if out_tuple:
-                        if key.startswith("vertex"):
-                            companion_key = key.replace("vertex", "edge")
-                            if companion_key in buffer:
-                                read_task_q.put((message.value.decode("utf-8"), 
-                                                 buffer[companion_key]))
-                                del buffer[companion_key]
-                                delivered_batch += 1
+                        # Keys are "vertex_batch_<id>" or "edge_batch_<id>".
+                        key = message.key.decode("utf-8")
+                        kind, _, batch_id = key.partition("_batch_")
+                        value = message.value
+                        with state.lock:
+                            if kind == "vertex":
+                                edge = state.edge_buf.pop(batch_id, None)
+                                if edge is None:
+                                    state.vertex_buf[batch_id] = value
+                                    continue
+                                data = (value, edge)
+                            elif kind == "edge":
+                                vertex = state.vertex_buf.pop(batch_id, None)
+                                if vertex is None:
+                                    state.edge_buf[batch_id] = value
+                                    continue
+                                data = (vertex, value)
                             else:
-                                buffer[key] = message.value.decode("utf-8")
-                        elif key.startswith("edge"):
-                            companion_key = key.replace("edge", "vertex")
-                            if companion_key in buffer:
-                                read_task_q.put((buffer[companion_key], 
-                                                 message.value.decode("utf-8")))
-                                del buffer[companion_key]
-                                delivered_batch += 1
-                            else:
-                                buffer[key] = message.value.decode("utf-8")
-                        else:
-                            raise ValueError(
-                                "Unrecognized key {} for messages in kafka".format(key)
-                            )
+                                raise ValueError(
+                                    "Unrecognized key {} for messages in kafka".format(key)
+                                )
                     else:
-                        read_task_q.put(message.value.decode("utf-8"))
-                        delivered_batch += 1
-        read_task_q.put(None)
+                        # Kept as bytes. The CSV readers take them without decoding.
+                        data = message.value
+                    batches.append(data)
+            read_task_q.put_many(batches)
+            with state.lock:
+                state.delivered += len(batches)
+        # The last downloader to finish tells the readers.
+        with state.lock:
+            state.running -= 1
+            last = not state.running
+        if last:
+            read_task_q.put(None)
 
     @staticmethod
     def _read_data(
@@ -567,37 +984,365 @@ class BaseLoader:
         e_attr_types: dict = {},
         add_self_loop: bool = False,
         reindex: bool = True,
-        is_hetero: bool = False
+        is_hetero: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False,
+        reader_barrier: Barrier = None
     ) -> NoReturn:
+        # The schema is fixed for the lifetime of the reader, so bind it once
+        # instead of passing it on every batch.
+        parse = partial(
+            BaseLoader._parse_data,
+            in_format = in_format,
+            out_format = out_format,
+            v_in_feats = v_in_feats,
+            v_out_labels = v_out_labels,
+            v_extra_feats = v_extra_feats,
+            v_attr_types = v_attr_types,
+            e_in_feats = e_in_feats,
+            e_out_labels = e_out_labels,
+            e_extra_feats = e_extra_feats,
+            e_attr_types = e_attr_types,
+            add_self_loop = add_self_loop,
+            reindex = reindex,
+            primary_id = {},
+            is_hetero = is_hetero,
+            feature_dtype = feature_dtype,
+            pin_memory = pin_memory
+        )
         while not exit_event.is_set():
             raw = in_q.get()
             if raw is None:
                 in_q.task_done()
+                if reader_barrier is not None:
+                    # Pass the end of data on to the other readers, and let only
+                    # one of them forward it once all readers are done.
+                    in_q.put(None)
+                    try:
+                        if reader_barrier.wait() != 0:
+                            break
+                    except BrokenBarrierError:
+                        break
                 out_q.put(None)
                 break
-            data = BaseLoader._parse_data(
-                raw = raw,
-                in_format = in_format,
-                out_format = out_format,
-                v_in_feats = v_in_feats,
-                v_out_labels = v_out_labels,
-                v_extra_feats = v_extra_feats,
-                v_attr_types = v_attr_types,
-                e_in_feats = e_in_feats,
-                e_out_labels = e_out_labels,
-                e_extra_feats = e_extra_feats,
-                e_attr_types = e_attr_types,
-                add_self_loop = add_self_loop,
-                reindex = reindex,
-                primary_id = {},
-                is_hetero = is_hetero
-            )
+            data = parse(raw)
             out_q.put(data)
             in_q.task_done()
+        else:
+            if reader_barrier is not None:
+                # Stopped early. Do not keep the other readers waiting for this one.
+                reader_barrier.abort()
+
+    @staticmethod
+    def _read_csv(
+        raw: Union[str, bytes],
+        names: list,
+        dtype: Union[str, Dict[str, str]] = None,
+        all_int: bool = False,
+        na_filter: bool = True,
+        float_cols: list = None
+    ) -> pd.DataFrame:
+        """Read a CSV string or UTF-8 bytes into a dataframe.
+
+        Use pyarrow's multithreaded CSV reader if pyarrow is installed, and
+        fall back to pandas otherwise. If `dtype` is "object", all columns are
+        read as strings. If it is a dict, each column is read as the dtype it
+        maps to. Otherwise, column types are inferred by pandas, since pyarrow
+        would only look at the first block of a large batch. If `all_int` is
+        True, all columns are expected to be integers and are first parsed
+        directly into an int64 array. If `na_filter` is False, empty strings are
+        kept as they are instead of becoming missing values. If `float_cols` is given, all
+        columns are expected to be numbers, with the given ones floating-point,
+        and are first parsed by a Numba kernel. If the data does not fit the given
+        dtypes, e.g. a list printed into a numeric attribute, the column types are
+        inferred instead.
+        """
+        if all_int and raw:
+            data = BaseLoader._read_int_csv(raw, names)
+            if data is not None:
+                return data
+        if float_cols and raw:
+            data = BaseLoader._read_numeric_csv(raw, names, float_cols)
+            if data is not None:
+                return data
+        if raw and dtype is not None:
+            try:
+                return BaseLoader._read_typed_csv(raw, names, dtype, na_filter)
+            except ValueError:
+                # The data does not fit the schema. pyarrow's ArrowInvalid is a ValueError too.
+                dtype = None
+        buf = io.BytesIO(raw) if isinstance(raw, bytes) else io.StringIO(raw)
+        return pd.read_csv(buf, header=None, names=names, dtype=dtype,
+                           na_filter=na_filter)
+
+    @staticmethod
+    def _read_typed_csv(
+        raw: Union[str, bytes],
+        names: list,
+        dtype: Union[str, Dict[str, str]],
+        na_filter: bool = True
+    ) -> pd.DataFrame:
+        """Read a CSV string or UTF-8 bytes into a dataframe with the given dtypes.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            pa = None
+        if pa is not None:
+            read_options = pa_csv.ReadOptions(
+                column_names=names, block_size=8 << 20, use_threads=True
+            )
+            if isinstance(dtype, dict):
+                column_types = {
+                    col: pa.string() if t == "object" else pa.from_numpy_dtype(np.dtype(t))
+                    for col, t in dtype.items()
+                }
+            else:
+                column_types = {col: pa.string() for col in names}
+            convert_options = pa_csv.ConvertOptions(
+                column_types=column_types,
+                strings_can_be_null=na_filter
+            )
+            table = pa_csv.read_csv(
+                pa.BufferReader(raw if isinstance(raw, bytes) else raw.encode("utf-8")),
+                read_options=read_options,
+                convert_options=convert_options
+            )
+            # Release the Arrow buffers column by column while converting,
+            # so that a large batch is not held in memory twice.
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        buf = io.BytesIO(raw) if isinstance(raw, bytes) else io.StringIO(raw)
+        return pd.read_csv(buf, header=None, names=names, dtype=dtype,
+                           na_filter=na_filter)
+
+    @staticmethod
+    def _read_int_csv(raw: Union[str, bytes], names: list) -> Union[pd.DataFrame, None]:
+        """Parse a CSV string of integers in a single pass.
+
+        Returns None if the string is not a complete table of integers.
+        """
+        newline = b"\n" if isinstance(raw, bytes) else "\n"
+        num_rows = raw.count(newline) + (not raw.endswith(newline))
+        arr = parse_int_csv(raw)
+        if arr is None:
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            with warnings.catch_warnings():
+                # Unparsable input only warns and stops early. It is caught by the size check.
+                warnings.simplefilter("ignore", DeprecationWarning)
+                arr = np.fromstring(raw.replace("\n", ","), dtype=np.int64, sep=",")
+        if arr.size != num_rows * len(names):
+            return None
+        return pd.DataFrame(arr.reshape(num_rows, len(names)), columns=names)
+
+    @staticmethod
+    def _read_numeric_csv(raw: Union[str, bytes], names: list, float_cols: list) -> Union[pd.DataFrame, None]:
+        """Parse a CSV string of integers and floats with the Numba kernel.
+
+        Returns None if Numba is not installed or the string does not match the columns.
+        """
+        is_float = np.isin(names, float_cols)
+        arrays = parse_numeric_csv(raw, is_float)
+        if arrays is None:
+            return None
+        ints, floats = arrays
+        int_cols, float_cols = iter(ints.T), iter(floats.T)
+        return pd.DataFrame({
+            col: next(float_cols) if f else next(int_cols)
+            for col, f in zip(names, is_float)
+        })
+
+    @staticmethod
+    def _float_columns(attributes: list, attr_types: dict) -> Union[list, None]:
+        """Get the floating-point attributes, or None if not all attributes are numbers.
+        """
+        types = [attr_types.get(col, "").upper() for col in attributes]
+        if not all(t in CSV_NUMERIC_DTYPES for t in types):
+            return None
+        return [col for col, t in zip(attributes, types) if t in ("FLOAT", "DOUBLE")]
+
+    @staticmethod
+    def _is_all_int(attributes: list, attr_types: dict) -> bool:
+        return all(attr_types.get(col, "").upper() in INT_ATTR_TYPES for col in attributes)
+
+    @staticmethod
+    def _csv_dtypes(attributes: list, attr_types: dict) -> Dict[str, str]:
+        """Map each column to the dtype to read it as.
+
+        Numeric attributes are parsed by the CSV reader directly. IDs and all
+        other attributes are read as strings and converted later.
+        """
+        return {
+            col: CSV_NUMERIC_DTYPES.get(attr_types.get(col, "").upper(), "object")
+            for col in attributes
+        }
+
+    @staticmethod
+    def _frame_dtypes(attributes: list, attr_types: dict, num_ids: int) -> Dict[str, str]:
+        """Map each column of a dataframe output to the dtype to read it as.
+
+        The first `num_ids` columns are integer vertex IDs. Numbers, including
+        booleans printed as 0 or 1, become int64, uint64 or float64 columns.
+        All other attributes are kept as strings.
+        """
+        dtypes = {col: "int64" for col in attributes[:num_ids]}
+        for col in attributes[num_ids:]:
+            dtype = CSV_NUMERIC_DTYPES.get(attr_types.get(col, "").upper(), "object")
+            dtypes[col] = "int64" if dtype == "int8" else dtype
+        return dtypes
+
+    @staticmethod
+    def _split_by_type(raw: Union[str, bytes]) -> Dict[str, str]:
+        """Group the lines of a CSV string by their first column, the vertex or edge type.
+
+        The type column is dropped and the lines of each type are joined back into a CSV string.
+        """
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        lines = defaultdict(list)
+        for line in raw.split("\n"):
+            if line:
+                vetype, _, rest = line.partition(",")
+                lines[vetype].append(rest)
+        return {vetype: "\n".join(rows) for vetype, rows in lines.items()}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _split_dtype(attr_type: str) -> Tuple[str, str]:
+        """Lowercase an attribute type and get the element type if it is a list.
+        """
+        dtype = attr_type.lower()
+        if dtype.startswith("list"):
+            return dtype, dtype.split(":")[1]
+        return dtype, None
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _print_attrs(alias: str, attr_names: Tuple[str, ...]) -> str:
+        """Build the GSQL expression that prints attributes of `alias` as CSV fields.
+
+        Cached since every loader on the same attributes builds the same string.
+        """
+        return '+","+'.join(["stringify({}.{})".format(alias, attr) for attr in attr_names])
+
+    @staticmethod
+    def _quantize_int8(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Quantize an (N, D) float array to int8 with one symmetric scale per column.
+
+        Returns the quantized array and the float32 scales, so that
+        `arr ~= quantized * scales`.
+        """
+        if len(arr):
+            scale = np.abs(arr).max(axis=0).astype(np.float32) / 127
+        else:
+            scale = np.ones(arr.shape[1], dtype=np.float32)
+        # All-zero columns would divide by zero.
+        scale[scale == 0] = 1
+        return np.rint(arr / scale).astype(np.int8), scale
+
+    @staticmethod
+    def _to_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Split a dataframe into a dict of NumPy arrays, one per column.
+        """
+        return {col: df[col].to_numpy() for col in df.columns}
+
+    @staticmethod
+    def _parse_list_column(
+        series: Union[pd.Series, np.ndarray], dtype: str
+    ) -> np.ndarray:
+        """Turn a column of space separated numbers into a 2D array.
+
+        All lists in the column are expected to have the same length. Numeric lists
+        are parsed in a single pass over the joined column if every row has the same
+        number of values. Anything else falls back to splitting each row.
+        """
+        if len(series) == 0:
+            return np.empty((0, 0), dtype=dtype)
+        if dtype.startswith(("int", "uint", "float", "double")):
+            try:
+                values = np.asarray(series, dtype=object).tolist()
+                num_cols = len(values[0].split())
+                joined = "\n".join(values)
+                # Count the values of each row: a value starts at a non-space
+                # character that follows whitespace or the start of the column.
+                buf = np.frombuffer(joined.encode("utf-8"), dtype=np.uint8)
+                is_space = (buf == 32) | (buf == 9) | (buf == 10) | (buf == 13)
+                starts = ~is_space & np.concatenate(([True], is_space[:-1]))
+                rows = np.cumsum(buf == 10)
+                counts = np.bincount(rows[starts], minlength=len(values))
+                if (counts == num_cols).all():
+                    with warnings.catch_warnings():
+                        # Unparsable input only warns and stops early. It is caught by the size check.
+                        warnings.simplefilter("ignore", DeprecationWarning)
+                        arr = np.fromstring(joined, dtype=dtype, sep=" ")
+                    if arr.size == num_cols * len(values):
+                        return arr.reshape(len(values), num_cols)
+            except (AttributeError, TypeError, ValueError):
+                pass
+        return pd.Series(series).str.split(expand=True).to_numpy().astype(dtype)
+
+    @staticmethod
+    def _add_self_loops(edgelist: np.ndarray) -> np.ndarray:
+        """Append a self-loop for every vertex to a 2 x E edge list.
+
+        Like PyG's `add_self_loops`, vertices are numbered up to the largest index in
+        the edge list. The result is written into one preallocated int64 array.
+        """
+        edgelist = edgelist.astype(np.int64, copy=False)
+        num_edges = edgelist.shape[1]
+        num_nodes = int(edgelist.max()) + 1 if num_edges else 0
+        out = np.empty((2, num_edges + num_nodes), dtype=np.int64)
+        out[:, :num_edges] = edgelist
+        out[0, num_edges:] = np.arange(num_nodes)
+        out[1, num_edges:] = out[0, num_edges:]
+        return out
+
+    @staticmethod
+    def _index_vids(vids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort vertex IDs of a batch for lookups with `_lookup_vids`.
+
+        Vertex IDs are unique within a batch. Numeric IDs are compared as
+        integers. Returns the sorted IDs and their original positions.
+        """
+        if vids.dtype == object:
+            try:
+                vids = vids.astype(np.int64)
+            except (TypeError, ValueError):
+                vids = vids.astype(str)
+        order = np.argsort(vids, kind="stable")
+        return vids[order], order
+
+    @staticmethod
+    def _lookup_vids(
+        vid_index: Tuple[np.ndarray, np.ndarray], keys: np.ndarray, out: np.ndarray = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the position of each key among the vertices indexed by `_index_vids`.
+
+        Returns the positions and a mask of the keys that are found. If `out`
+        is given, the positions are written into it, e.g., a row of an edge list.
+        """
+        sorted_vids, order = vid_index
+        if len(sorted_vids) == 0:
+            if out is None:
+                out = np.empty(len(keys), dtype=np.int64)
+            out[:] = 0
+            return out, np.zeros(len(keys), dtype=bool)
+        if keys.dtype != sorted_vids.dtype:
+            if sorted_vids.dtype.kind == "i":
+                keys = keys.astype(np.int64)
+            else:
+                keys = keys.astype(str)
+        pos = np.searchsorted(sorted_vids, keys)
+        pos[pos == len(sorted_vids)] = 0
+        found = sorted_vids[pos] == keys
+        if out is not None:
+            return np.take(order, pos, out=out), found
+        return order[pos].astype(np.int64, copy=False), found
 
     @staticmethod
     def _parse_data(
-        raw: Union[str, Tuple[str, str]],
+        raw: Union[str, bytes, Tuple[str, str], Tuple[bytes, bytes]],
         in_format: 'Literal["vertex", "edge", "graph"]' = "vertex",
         out_format: str = "dataframe",
         v_in_feats: Union[list, dict] = [],
@@ -611,44 +1356,106 @@ class BaseLoader:
         add_self_loop: bool = False,
         reindex: bool = True,
         primary_id: dict = {},
-        is_hetero: bool = False
+        is_hetero: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False
     ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], "dgl.DGLGraph", "pyg.data.Data", "spektral.data.graph.Graph",
                dict, Tuple[dict, dict], "pyg.data.HeteroData"]:
         """Parse raw data into dataframes, DGL graphs, or PyG graphs.
         """    
+        def column_to_array(column: np.ndarray, dtype: str, dtype2: str) -> np.ndarray:
+            """Convert a non-string column into an array of its attribute type.
+
+            Columns that already have the right type are only copied if they are
+            read-only (e.g. backed by Arrow memory), since tensors need writable memory,
+            or strided views into a parsed table, which would keep the whole table alive.
+            """
+            if dtype2:
+                return BaseLoader._parse_list_column(column, dtype2)
+            elif dtype == "bool":
+                arr = column.astype("int8", copy=False).astype(dtype, copy=False)
+            else:
+                arr = column.astype(dtype, copy=False)
+            if arr.flags.writeable and arr.flags.c_contiguous:
+                return arr
+            return arr.copy()
+
         def attr_to_tensor(
-            attributes: list, attr_types: dict, df: pd.DataFrame
+            attributes: list, attr_types: dict, df: Dict[str, np.ndarray],
+            out_dtype: str = None
         ) -> "torch.Tensor":
-            """Turn multiple columns of a dataframe into a tensor.
+            """Turn multiple columns into a tensor.
+
+            If `out_dtype` is given, floating-point results are cast to it. Float
+            attributes are parsed straight into it if NumPy supports it. For "int8"
+            they are quantized instead, and the per-column scales are returned
+            alongside the tensor. The scales are None otherwise.
             """        
-            x = []
+            quantize = out_dtype == "int8"
+            if quantize:
+                np_out_dtype = "float32"
+            else:
+                np_out_dtype = out_dtype if out_dtype and hasattr(np, out_dtype) else None
+            x, dtypes = [], []
             for col in attributes:
-                dtype = attr_types[col].lower()
+                dtype, dtype2 = BaseLoader._split_dtype(attr_types[col])
                 if dtype.startswith("str"):
                     raise TypeError(
                         "String type not allowed for input and output features."
                     )
-                if dtype.startswith("list"):
-                    dtype2 = dtype.split(":")[1]
-                    x.append(df[col].str.split(expand=True).to_numpy().astype(dtype2))
-                elif dtype.startswith("set") or dtype.startswith("map") or dtype.startswith("date"):
+                if dtype.startswith("set") or dtype.startswith("map") or dtype.startswith("date"):
                     raise NotImplementedError(
                         "{} type not supported for input and output features yet.".format(dtype))
-                elif dtype == "bool":
-                    x.append(df[[col]].astype("int8").to_numpy().astype(dtype))
-                else:
-                    x.append(df[[col]].to_numpy().astype(dtype))
+                if np_out_dtype and (dtype2 or dtype) in ("float", "double"):
+                    # Skip the float64 copy that would only be cast down at the end.
+                    if dtype2:
+                        dtype2 = np_out_dtype
+                    else:
+                        dtype = np_out_dtype
+                column = df[col]
+                if len(attributes) > 1 and not dtype2 and dtype != "bool" and column.dtype.kind in "iuf":
+                    # Numeric columns are cast while they are copied into the
+                    # feature matrix below, instead of through a temporary array.
+                    x.append(column)
+                    dtypes.append(np.dtype(dtype))
+                    continue
+                arr = column_to_array(column, dtype, dtype2)
+                x.append(arr)
+                dtypes.append(arr.dtype)
+            if len(x) == 1:
+                # A single column is already the result.
+                arr = x[0] if x[0].ndim == 2 else x[0].reshape(-1, 1)
+            else:
+                # Gather all columns into one contiguous (N, D) array.
+                widths = [a.shape[1] if a.ndim == 2 else 1 for a in x]
+                arr = np.empty((len(x[0]), sum(widths)), dtype=np.result_type(*dtypes))
+                start = 0
+                for a, width in zip(x, widths):
+                    arr[:, start:start + width] = a.reshape(-1, width)
+                    start += width
+            scale = None
+            if quantize and arr.dtype.kind == "f":
+                arr, scale = BaseLoader._quantize_int8(arr)
             if mode == "pyg" or mode == "dgl":
-                return torch.tensor(np.hstack(x)).squeeze(dim=1)
+                # The arrays are freshly converted, so share their memory instead of copying.
+                tensor = torch.from_numpy(arr).squeeze(dim=1)
+                if out_dtype and tensor.is_floating_point():
+                    tensor = tensor.to(getattr(torch, out_dtype))
+                if scale is not None:
+                    scale = torch.from_numpy(scale)
+                return tensor, scale
             elif mode == "spektral":
+                if out_dtype and arr.dtype.kind == "f":
+                    arr = arr.astype(out_dtype)
                 try:
-                    return np.squeeze(np.hstack(x), axis=1) #throws an error if axis isn't 1
+                    return np.squeeze(arr, axis=1), scale #throws an error if axis isn't 1
                 except:
-                    return np.hstack(x)
+                    return arr, scale
 
-        def add_attributes(attr_names: list, attr_types: dict, attr_df: pd.DataFrame, 
+        def add_attributes(attr_names: list, attr_types: dict, attr_df: Dict[str, np.ndarray], 
                            graph, is_hetero: bool, mode: str, feat_name: str, 
-                           target: 'Literal["edge", "vertex"]', vetype: str = None) -> None:
+                           target: 'Literal["edge", "vertex"]', vetype: str = None,
+                           out_dtype: str = None) -> None:
             """Add multiple attributes as a single feature to edges or vertices.
             """                    
             if is_hetero:
@@ -676,9 +1483,18 @@ class BaseLoader:
                     elif target == "vertex":
                         data = graph.ndata
 
-            data[feat_name] = attr_to_tensor(attr_names, attr_types, attr_df)
+            data[feat_name], scale = attr_to_tensor(attr_names, attr_types, attr_df, out_dtype)
+            if scale is not None:
+                # Scales are per column, not per vertex or edge, so DGL keeps
+                # them with the graph instead of in its node or edge data.
+                if mode == "dgl" and is_hetero:
+                    graph.extra_data.setdefault(feat_name + "_scale", {})[vetype] = scale
+                elif mode == "dgl":
+                    graph.extra_data[feat_name + "_scale"] = scale
+                else:
+                    data[feat_name + "_scale"] = scale
         
-        def add_sep_attr(attr_names: list, attr_types: dict, attr_df: pd.DataFrame, 
+        def add_sep_attr(attr_names: list, attr_types: dict, attr_df: Dict[str, np.ndarray], 
                          graph, is_hetero: bool, mode: str,
                          target: 'Literal["edge", "vertex"]', vetype: str = None) -> None:
             """Add each attribute as a single feature to edges or vertices.
@@ -709,46 +1525,25 @@ class BaseLoader:
                         data = graph.ndata
 
             for col in attr_names:
-                dtype = attr_types[col].lower()
-                if dtype.startswith("str"):
-                    if mode == "dgl":
-                        graph.extra_data[col] = attr_df[col].to_list()
-                    elif mode == "pyg" or mode == "spektral":
-                        data[col] = attr_df[col].to_list()
-                elif dtype.startswith("list"):
-                    dtype2 = dtype.split(":")[1]
-                    if dtype2.startswith("str"):
-                        if mode == "dgl":
-                            graph.extra_data[col] = attr_df[col].str.split().to_list()
-                        elif mode == "pyg" or mode == "spektral":
-                            data[col] = attr_df[col].str.split().to_list()
-                    else:
-                        if mode == "pyg" or mode == "dgl":
-                            data[col] = torch.tensor(
-                                attr_df[col]
-                                .str.split(expand=True)
-                                .to_numpy()
-                                .astype(dtype2)
-                            )
-                        elif mode == "spektral":
-                            data[col] = attr_df[col].str.split(expand=True).to_numpy().astype(dtype2)
-                elif dtype.startswith("set") or dtype.startswith("map") or dtype.startswith("date"):
+                dtype, dtype2 = BaseLoader._split_dtype(attr_types[col])
+                if dtype.startswith("set") or dtype.startswith("map") or dtype.startswith("date"):
                     raise NotImplementedError(
                         "{} type not supported for extra features yet.".format(dtype))
-                elif dtype == "bool":
-                    if mode == "pyg" or mode == "dgl":
-                        data[col] = torch.tensor(
-                            attr_df[col].astype("int8").astype(dtype)
-                        )
-                    elif mode == "spektral":
-                        data[col] = attr_df[col].astype("int8").astype(dtype)
-                else:
-                    if mode == "pyg" or mode == "dgl":
-                        data[col] = torch.tensor(
-                            attr_df[col].astype(dtype)
-                        )
-                    elif mode == "spektral":
-                        data[col] = attr_df[col].astype(dtype)
+                if dtype.startswith("str") or (dtype2 and dtype2.startswith("str")):
+                    # Strings are kept as Python lists. DGL can only store them on the graph.
+                    if dtype2:
+                        values = [
+                            i.split() if isinstance(i, str) else [] for i in attr_df[col]
+                        ]
+                    else:
+                        values = attr_df[col].tolist()
+                    if mode == "dgl":
+                        graph.extra_data[col] = values
+                    else:
+                        data[col] = values
+                    continue
+                arr = column_to_array(attr_df[col], dtype, dtype2)
+                data[col] = arr if mode == "spektral" else torch.from_numpy(arr)
         
         # Read in vertex and edge CSVs as dataframes              
         vertices, edges = None, None
@@ -756,84 +1551,93 @@ class BaseLoader:
             # String of vertices in format vid,v_in_feats,v_out_labels,v_extra_feats
             if not is_hetero:
                 v_attributes = ["vid"] + v_in_feats + v_out_labels + v_extra_feats
-                data = pd.read_csv(io.StringIO(raw), header=None, names=v_attributes)
+                data = BaseLoader._read_csv(
+                    raw, v_attributes,
+                    dtype=BaseLoader._frame_dtypes(v_attributes, v_attr_types, 1),
+                    all_int=BaseLoader._is_all_int(v_attributes[1:], v_attr_types),
+                    float_cols=BaseLoader._float_columns(v_attributes[1:], v_attr_types))
             else:
-                v_file = (line.split(',') for line in raw.split('\n') if line)
-                v_file_dict = defaultdict(list)
-                for line in v_file:
-                    v_file_dict[line[0]].append(line[1:])
                 vertices = {}
-                for vtype in v_file_dict:
+                for vtype, v_file in BaseLoader._split_by_type(raw).items():
                     v_attributes = ["vid"] + \
                                    v_in_feats.get(vtype, []) + \
                                    v_out_labels.get(vtype, []) + \
                                    v_extra_feats.get(vtype, [])
-                    vertices[vtype] = pd.DataFrame(v_file_dict[vtype], columns=v_attributes)
+                    vertices[vtype] = BaseLoader._read_csv(
+                        v_file, v_attributes, dtype="object", na_filter=False)
                 data = vertices
         elif in_format == "edge":
             # String of edges in format source_vid,target_vid
             if not is_hetero:
                 e_attributes = ["source", "target"] + e_in_feats + e_out_labels + e_extra_feats
-                data = pd.read_csv(io.StringIO(raw), header=None, names=e_attributes)
+                data = BaseLoader._read_csv(
+                    raw, e_attributes,
+                    dtype=BaseLoader._frame_dtypes(e_attributes, e_attr_types, 2),
+                    all_int=BaseLoader._is_all_int(e_attributes[2:], e_attr_types),
+                    float_cols=BaseLoader._float_columns(e_attributes[2:], e_attr_types))
             else:
-                e_file = (line.split(',') for line in raw.split('\n') if line)
-                e_file_dict = defaultdict(list)
-                for line in e_file:
-                    e_file_dict[line[0]].append(line[1:])
                 edges = {}
-                for etype in e_file_dict:
+                for etype, e_file in BaseLoader._split_by_type(raw).items():
                     e_attributes = ["source", "target"] + \
                                    e_in_feats.get(etype, []) + \
                                    e_out_labels.get(etype, [])  + \
                                    e_extra_feats.get(etype, [])
-                    edges[etype] = pd.DataFrame(e_file_dict[etype], columns=e_attributes)
-                del e_file_dict, e_file
+                    edges[etype] = BaseLoader._read_csv(
+                        e_file, e_attributes, dtype="object", na_filter=False)
                 data = edges
         elif in_format == "graph":
             # A pair of in-memory CSVs (vertex, edge)
             v_file, e_file = raw
+            # Graphs get numeric attributes parsed by the CSV reader, while dataframes keep strings.
+            typed = out_format.lower() != "dataframe"
             if not is_hetero:
                 v_attributes = ["vid"] + v_in_feats + v_out_labels + v_extra_feats
                 e_attributes = ["source", "target"] + e_in_feats + e_out_labels + e_extra_feats
-                vertices = pd.read_csv(io.StringIO(v_file), header=None, names=v_attributes, dtype="object")
+                vertices = BaseLoader._read_csv(
+                    v_file, v_attributes,
+                    dtype=BaseLoader._csv_dtypes(v_attributes, v_attr_types) if typed else "object")
                 if primary_id:
                     id_map = pd.DataFrame({"vid": primary_id.keys(), "primary_id": primary_id.values()}, 
                                           dtype="object")
                     vertices = vertices.merge(id_map, on="vid")
                     v_extra_feats.append("primary_id")
-                edges = pd.read_csv(io.StringIO(e_file), header=None, names=e_attributes, dtype="object")
+                if typed and BaseLoader._is_all_int(e_attributes[2:], e_attr_types):
+                    # Integer edges skip the string conversion when they become graphs.
+                    edges = BaseLoader._read_csv(
+                        e_file, e_attributes,
+                        dtype=BaseLoader._csv_dtypes(e_attributes, e_attr_types), all_int=True)
+                else:
+                    edges = BaseLoader._read_csv(
+                        e_file, e_attributes,
+                        dtype=BaseLoader._csv_dtypes(e_attributes, e_attr_types) if typed else "object")
                 data = (vertices, edges)
             else:
-                v_file = (line.split(',') for line in v_file.split('\n') if line)
-                v_file_dict = defaultdict(list)
-                for line in v_file:
-                    v_file_dict[line[0]].append(line[1:])
                 vertices = {}
-                for vtype in v_file_dict:
+                for vtype, v_csv in BaseLoader._split_by_type(v_file).items():
                     v_attributes = ["vid"] + \
                                    v_in_feats.get(vtype, []) + \
                                    v_out_labels.get(vtype, []) + \
                                    v_extra_feats.get(vtype, [])
-                    vertices[vtype] = pd.DataFrame(v_file_dict[vtype], columns=v_attributes, dtype="object")
+                    vertices[vtype] = BaseLoader._read_csv(
+                        v_csv, v_attributes,
+                        dtype=BaseLoader._csv_dtypes(v_attributes, v_attr_types[vtype]) if typed else "object",
+                        na_filter=False)
                 if primary_id:
                     id_map = pd.DataFrame({"vid": primary_id.keys(), "primary_id": primary_id.values()},
                                           dtype="object")
                     for vtype in vertices:
                         vertices[vtype] = vertices[vtype].merge(id_map, on="vid")
                         v_extra_feats[vtype].append("primary_id")
-                del v_file_dict, v_file
-                e_file = (line.split(',') for line in e_file.split('\n') if line)
-                e_file_dict = defaultdict(list)
-                for line in e_file:
-                    e_file_dict[line[0]].append(line[1:])
                 edges = {}
-                for etype in e_file_dict:
+                for etype, e_csv in BaseLoader._split_by_type(e_file).items():
                     e_attributes = ["source", "target"] + \
                                    e_in_feats.get(etype, []) + \
                                    e_out_labels.get(etype, [])  + \
                                    e_extra_feats.get(etype, [])
-                    edges[etype] = pd.DataFrame(e_file_dict[etype], columns=e_attributes, dtype="object")
-                del e_file_dict, e_file
+                    edges[etype] = BaseLoader._read_csv(
+                        e_csv, e_attributes,
+                        dtype=BaseLoader._csv_dtypes(e_attributes, e_attr_types[etype]) if typed else "object",
+                        na_filter=False)
                 data = (vertices, edges)
         else:
             raise NotImplementedError
@@ -862,7 +1666,6 @@ class BaseLoader:
                     from torch_geometric.data import Data as pygData
                     from torch_geometric.data import \
                         HeteroData as pygHeteroData
-                    from torch_geometric.utils import add_self_loops
                     mode = "pyg"
                 except ImportError:
                     raise ImportError(
@@ -896,23 +1699,34 @@ class BaseLoader:
             return data
         else:
             raise NotImplementedError
+        # Work on plain NumPy columns from here on.
+        if not is_hetero:
+            vertices = BaseLoader._to_columns(vertices)
+            edges = BaseLoader._to_columns(edges)
+        else:
+            vertices = {k: BaseLoader._to_columns(v) for k, v in vertices.items()}
+            edges = {k: BaseLoader._to_columns(v) for k, v in edges.items()}
         # Reformat as a graph.
         # Need to have a pair of tables for edges and vertices.
         if not is_hetero:
             # Deal with edgelist first
             if reindex:
-                vertices["tmp_id"] = range(len(vertices))
-                id_map = vertices[["vid", "tmp_id"]]
-                edges = edges.merge(id_map, left_on="source", right_on="vid")
-                edges.drop(columns=["source", "vid"], inplace=True)
-                edges = edges.merge(id_map, left_on="target", right_on="vid")
-                edges.drop(columns=["target", "vid"], inplace=True)
-                edgelist = edges[["tmp_id_x", "tmp_id_y"]]
+                vid_index = BaseLoader._index_vids(vertices["vid"])
+                # Look up both ends straight into the rows of the edge list.
+                edgelist = np.empty((2, len(edges["source"])), dtype=np.int64)
+                _, source_found = BaseLoader._lookup_vids(vid_index, edges["source"], edgelist[0])
+                _, target_found = BaseLoader._lookup_vids(vid_index, edges["target"], edgelist[1])
+                found = source_found & target_found
+                if not found.all():
+                    edges = {col: val[found] for col, val in edges.items()}
+                    edgelist = edgelist[:, found]
             else:
-                edgelist = edges[["source", "target"]]
+                edgelist = np.stack((edges["source"], edges["target"]))
 
             if mode == "dgl" or mode == "pyg":
-                edgelist = torch.tensor(edgelist.to_numpy().T, dtype=torch.long)
+                if mode == "pyg" and add_self_loop:
+                    edgelist = BaseLoader._add_self_loops(edgelist)
+                edgelist = torch.from_numpy(edgelist.astype(np.int64, copy=False))
                 if mode == "dgl":
                     data = dgl.graph(data=(edgelist[0], edgelist[1]))
                     if add_self_loop:
@@ -920,14 +1734,12 @@ class BaseLoader:
                     data.extra_data = {}
                 elif mode == "pyg":
                     data = pygData()
-                    if add_self_loop:
-                        edgelist = add_self_loops(edgelist)[0]
                     data["edge_index"] = edgelist
             elif mode == "spektral":
-                n_edges = len(edgelist)
-                n_vertices = len(vertices)
+                n_edges = edgelist.shape[1]
+                n_vertices = len(vertices["vid"])
                 adjacency_data = [1 for i in range(n_edges)] #spektral adjacency format requires weights for each edge to initialize
-                adjacency = scipy.sparse.coo_matrix((adjacency_data, (edgelist["tmp_id_x"], edgelist["tmp_id_y"])), shape=(n_vertices, n_vertices))
+                adjacency = scipy.sparse.coo_matrix((adjacency_data, (edgelist[0], edgelist[1])), shape=(n_vertices, n_vertices))
                 if add_self_loop:
                     adjacency = spektral.utils.add_self_loops(adjacency, value=1)
                 edge_index = np.stack((adjacency.row, adjacency.col), axis=-1)
@@ -936,7 +1748,8 @@ class BaseLoader:
             # Deal with edge attributes
             if e_in_feats:
                 add_attributes(e_in_feats, e_attr_types, edges, 
-                                data, is_hetero, mode, "edge_feat", "edge")
+                                data, is_hetero, mode, "edge_feat", "edge",
+                                out_dtype=feature_dtype)
                 if mode == "spektral":
                     edge_data = data["edge_feat"]
                     edge_index, edge_data = spektral.utils.reorder(edge_index, edge_features=edge_data)
@@ -955,7 +1768,8 @@ class BaseLoader:
             # Deal with vertex attributes next
             if v_in_feats:
                 add_attributes(v_in_feats, v_attr_types, vertices, 
-                                data, is_hetero, mode, "x", "vertex")
+                                data, is_hetero, mode, "x", "vertex",
+                                out_dtype=feature_dtype)
             if v_out_labels:
                 add_attributes(v_out_labels, v_attr_types, vertices, 
                                 data, is_hetero, mode, "y", "vertex")
@@ -968,37 +1782,44 @@ class BaseLoader:
             # Deal with edgelist first
             edgelist = {}
             if reindex:
-                    id_map = {}
-                    for vtype in vertices:
-                        vertices[vtype]["tmp_id"] = range(len(vertices[vtype]))
-                        id_map[vtype] = vertices[vtype][["vid", "tmp_id"]]
-                    for etype in edges:
-                        source_type = e_attr_types[etype]["FromVertexTypeName"]
-                        target_type = e_attr_types[etype]["ToVertexTypeName"]
-                        if e_attr_types[etype]["IsDirected"] or source_type==target_type:
-                            edges[etype] = edges[etype].merge(id_map[source_type], left_on="source", right_on="vid")
-                            edges[etype].drop(columns=["source", "vid"], inplace=True)
-                            edges[etype] = edges[etype].merge(id_map[target_type], left_on="target", right_on="vid")
-                            edges[etype].drop(columns=["target", "vid"], inplace=True)
-                            edgelist[etype] = edges[etype][["tmp_id_x", "tmp_id_y"]]
-                        else:
-                            subdf1 = edges[etype].merge(id_map[source_type], left_on="source", right_on="vid")
-                            subdf1.drop(columns=["source", "vid"], inplace=True)
-                            subdf1 = subdf1.merge(id_map[target_type], left_on="target", right_on="vid")
-                            subdf1.drop(columns=["target", "vid"], inplace=True)
-                            if len(subdf1) < len(edges[etype]):
-                                subdf2 = edges[etype].merge(id_map[source_type], left_on="target", right_on="vid")
-                                subdf2.drop(columns=["target", "vid"], inplace=True)
-                                subdf2 = subdf2.merge(id_map[target_type], left_on="source", right_on="vid")
-                                subdf2.drop(columns=["source", "vid"], inplace=True)
-                                subdf1 = pd.concat((subdf1, subdf2), ignore_index=True)
-                            edges[etype] = subdf1
-                            edgelist[etype] = edges[etype][["tmp_id_x", "tmp_id_y"]]
+                vid_index = {
+                    vtype: BaseLoader._index_vids(vertices[vtype]["vid"])
+                    for vtype in vertices
+                }
+                for etype in edges:
+                    source_type = e_attr_types[etype]["FromVertexTypeName"]
+                    target_type = e_attr_types[etype]["ToVertexTypeName"]
+                    sources = edges[etype]["source"]
+                    targets = edges[etype]["target"]
+                    pairs = np.empty((2, len(sources)), dtype=np.int64)
+                    source, source_found = BaseLoader._lookup_vids(vid_index[source_type], sources, pairs[0])
+                    target, target_found = BaseLoader._lookup_vids(vid_index[target_type], targets, pairs[1])
+                    found = source_found & target_found
+                    if found.all():
+                        edgelist[etype] = pairs
+                    elif e_attr_types[etype]["IsDirected"] or source_type==target_type:
+                        edges[etype] = {col: val[found] for col, val in edges[etype].items()}
+                        edgelist[etype] = pairs[:, found]
+                    else:
+                        # Undirected edges between two types can come in either direction.
+                        rev_source, rev_source_found = BaseLoader._lookup_vids(vid_index[source_type], targets)
+                        rev_target, rev_target_found = BaseLoader._lookup_vids(vid_index[target_type], sources)
+                        rev_found = rev_source_found & rev_target_found
+                        edges[etype] = {
+                            col: np.concatenate((val[found], val[rev_found]))
+                            for col, val in edges[etype].items()
+                        }
+                        edgelist[etype] = np.stack((
+                            np.concatenate((source[found], rev_source[rev_found])),
+                            np.concatenate((target[found], rev_target[rev_found]))
+                        ))
             else:
                 for etype in edges:
-                    edgelist[etype] = edges[etype][["source", "target"]]
+                    edgelist[etype] = np.stack((edges[etype]["source"], edges[etype]["target"]))
             for etype in edges:
-                edgelist[etype] = torch.tensor(edgelist[etype].to_numpy().T, dtype=torch.long)
+                if mode == "pyg" and add_self_loop:
+                    edgelist[etype] = BaseLoader._add_self_loops(edgelist[etype])
+                edgelist[etype] = torch.from_numpy(edgelist[etype].astype(np.int64, copy=False))
             if mode == "dgl":
                 data = dgl.heterograph({
                     (e_attr_types[etype]["FromVertexTypeName"], etype, e_attr_types[etype]["ToVertexTypeName"]): (edgelist[etype][0], edgelist[etype][1]) for etype in edgelist})
@@ -1008,8 +1829,6 @@ class BaseLoader:
             elif mode == "pyg":
                 data = pygHeteroData()
                 for etype in edgelist:
-                    if add_self_loop:
-                        edgelist[etype] = add_self_loops(edgelist[etype])[0]
                     data[e_attr_types[etype]["FromVertexTypeName"], 
                         etype,
                         e_attr_types[etype]["ToVertexTypeName"]].edge_index = edgelist[etype]
@@ -1022,7 +1841,8 @@ class BaseLoader:
                     if etype not in e_in_feats:
                         continue
                     add_attributes(e_in_feats[etype], e_attr_types[etype], edges[etype], 
-                                    data, is_hetero, mode, "edge_feat", "edge", etype)
+                                    data, is_hetero, mode, "edge_feat", "edge", etype,
+                                    feature_dtype)
             if e_out_labels:
                 for etype in edges:
                     if etype not in e_out_labels:
@@ -1042,7 +1862,8 @@ class BaseLoader:
                     if vtype not in v_in_feats:
                         continue
                     add_attributes(v_in_feats[vtype], v_attr_types[vtype], vertices[vtype], 
-                                    data, is_hetero, mode, "x", "vertex", vtype)
+                                    data, is_hetero, mode, "x", "vertex", vtype,
+                                    feature_dtype)
             if v_out_labels:
                 for vtype in vertices:
                     if vtype not in v_out_labels:
@@ -1056,28 +1877,59 @@ class BaseLoader:
                     add_sep_attr(v_extra_feats[vtype], v_attr_types[vtype], vertices[vtype],
                                 data, is_hetero, mode, "vertex", vtype)   
             del vertices
+        if pin_memory:
+            # Page-locked tensors let `.to(device, non_blocking=True)` overlap
+            # the copy to the GPU with compute.
+            if mode == "pyg":
+                data = data.pin_memory()
+            elif mode == "dgl":
+                data.pin_memory_()
         return data
 
+    @staticmethod
+    def _check_feature_dtype(feature_dtype: str, output_format: str) -> str:
+        """Check that input features can be converted to `feature_dtype`.
+
+        Raised here rather than in a reader thread, where it would only stall the loader.
+        """
+        if feature_dtype is None:
+            return None
+        supported = ["float16", "float32", "float64", "int8"]
+        if output_format.lower() in ("pyg", "dgl"):
+            supported.append("bfloat16")
+        if feature_dtype not in supported:
+            raise ValueError(
+                "feature_dtype {} is not supported for {} output. Please use one of {}.".format(
+                    feature_dtype, output_format, ", ".join(supported))
+            )
+        return feature_dtype
+
     def _start_request(self, out_tuple: bool, resp_type: str):
         # If using kafka
         if self.kafka_address_consumer:
             # Generate topic
             self._set_kafka_topic()
-            # Start consumer thread
-            self._downloader = Thread(
-                target=self._download_from_kafka,
-                args=(
-                    self._exit_event,
-                    self._read_task_q,
-                    self.num_batches,
-                    out_tuple,
-                    self._kafka_consumer,
-                ),
-            )
-            self._downloader.start()
+            # Start consumer threads, one per partition
+            state = _DownloadState(len(self._kafka_consumers))
+            self._downloaders = [
+                self._new_thread(
+                    target=self._download_from_kafka,
+                    args=(
+                        self._exit_event,
+                        self._read_task_q,
+                        self.num_batches,
+                        out_tuple,
+                        consumer,
+                        state,
+                    ),
+                )
+                for consumer in self._kafka_consumers
+            ]
+            for downloader in self._downloaders:
+                downloader.start()
             # Start requester thread
             if not self.kafka_skip_produce:
-                self._requester = Thread(
+                self._requester = self._new_thread(
                     target=self._request_kafka,
                     args=(
                         self._exit_event,
@@ -1090,38 +1942,124 @@ class BaseLoader:
                 self._requester.start()
         else:
             # Otherwise, use rest api
-            self._requester = Thread(
+            response = None
+            if self.prefetch_depth > 0 and not self._inline:
+                response = self._prefetch_rest()
+            self._requester = self._new_thread(
                 target=self._request_rest,
                 args=(
-                    self._graph,
-                    self.query_name,
+                    self._run_query,
                     self._read_task_q,
-                    self.timeout,
                     self._payload,
                     resp_type,
+                    response,
                 ),
             )
             self._requester.start()
 
+    def _prefetch_rest(self) -> Future:
+        """Get the response for this epoch and request the next `prefetch_depth` epochs.
+        """
+        if self._rest_pool is None:
+            self._rest_pool = ThreadPoolExecutor(max_workers=self.prefetch_depth)
+        while len(self._rest_responses) <= self.prefetch_depth:
+            self._rest_responses.append(
+                self._rest_pool.submit(self._run_query, dict(self._payload))
+            )
+        return self._rest_responses.popleft()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _malloc_trim():
+        """Get glibc's `malloc_trim`, or None if the C library does not have it.
+        """
+        try:
+            return ctypes.CDLL("libc.so.6").malloc_trim
+        except (OSError, AttributeError):
+            return None
+
+    @staticmethod
+    def _numa_cpus(numa_node: int) -> set:
+        """Get the CPUs of a NUMA node that this process may run on, or None if
+        pinning is not supported.
+        """
+        if isinstance(numa_node, bool) or not isinstance(numa_node, int) or numa_node < 0:
+            raise ValueError(
+                "numa_node must be a non-negative integer, got {!r}.".format(numa_node)
+            )
+        if not hasattr(os, "sched_setaffinity"):
+            logging.warning("Thread pinning is only supported on Linux. Ignoring numa_node.")
+            return None
+        node_dir = "/sys/devices/system/node/node{}".format(numa_node)
+        if not os.path.isdir(node_dir):
+            raise ValueError("numa_node {} does not exist on this machine.".format(numa_node))
+        cpus = set()
+        with open(os.path.join(node_dir, "cpulist")) as f:
+            for part in f.read().strip().split(","):
+                if not part:
+                    continue
+                start, _, end = part.partition("-")
+                cpus.update(range(int(start), int(end or start) + 1))
+        # Pinning to CPUs outside of the process's cpuset fails, e.g., in a container.
+        cpus &= os.sched_getaffinity(0)
+        if not cpus:
+            raise ValueError(
+                "None of the CPUs of numa_node {} are available to this process.".format(numa_node)
+            )
+        return cpus
+
+    def _new_thread(self, target, args: tuple = (), kwargs: dict = None) -> Thread:
+        if self._inline:
+            return _InlineThread(target=target, args=args, kwargs=kwargs)
+        cpus = self._cpu_affinity
+        out_q = self._data_q
+        def run(*args, **kwargs):
+            try:
+                if cpus:
+                    # Pin first, so that everything the thread allocates is local to the node.
+                    os.sched_setaffinity(0, cpus)
+                return target(*args, **kwargs)
+            except Exception as err:
+                logging.error("Loader thread failed: {}".format(err))
+                barrier = kwargs.get("reader_barrier")
+                if barrier is not None:
+                    # Do not keep the other readers waiting for this one.
+                    barrier.abort()
+                out_q.put(_ThreadFailure(err))
+        return Thread(target=run, args=args, kwargs=kwargs)
+
+    def _start_readers(self, args: tuple) -> None:
+        num_readers = self.reader_threads
+        if self._inline:
+            # All data is put before any is taken, so the output cannot be bounded.
+            num_readers = 1
+            self._data_q.maxsize = 0
+        barrier = Barrier(num_readers) if num_readers > 1 else None
+        self._readers = [
+            self._new_thread(self._read_data, args, {"reader_barrier": barrier})
+            for _ in range(num_readers)
+        ]
+        for reader in self._readers:
+            reader.start()
+
     def _start(self) -> None:
         # This is a template. Implement your own logics here.
         # Create task and result queues
-        self._request_task_q = Queue()
-        self._read_task_q = Queue()
-        self._data_q = Queue(self._buffer_size)
+        self._read_task_q = _BatchQueue()
+        self._data_q = _BatchQueue(self._buffer_size)
         self._exit_event = Event()
 
         # Start requesting thread. Finish with your logic.
-        self._requester = Thread(target=self._request_kafka, args=())
+        self._requester = self._new_thread(target=self._request_kafka, args=())
         self._requester.start()
 
         # Start downloading thread. Finish with your logic.
-        self._downloader = Thread(target=self._download_from_kafka, args=())
-        self._downloader.start()
+        self._downloaders = [self._new_thread(target=self._download_from_kafka, args=())]
+        for downloader in self._downloaders:
+            downloader.start()
 
         # Start reading thread. Finish with your logic.
-        self._reader = Thread(target=self._read_data, args=())
-        self._reader.start()
+        self._start_readers(args=())
 
         raise NotImplementedError
 
@@ -1146,6 +2084,9 @@ class BaseLoader:
         if data is None:
             self._iterator = False
             raise StopIteration
+        if isinstance(data, _ThreadFailure):
+            self._iterator = False
+            raise data.error
         return data
 
     @property
@@ -1156,8 +2097,16 @@ class BaseLoader:
         if self.num_batches == 1:
             if self._data is None:
                 self._reset()
-                self._start()
-                self._data = self._data_q.get()
+                # A single batch from REST needs no pipeline. Fetch and parse it here.
+                self._inline = not self.kafka_address_consumer
+                try:
+                    self._start()
+                finally:
+                    self._inline = False
+                data = self._data_q.get()
+                if isinstance(data, _ThreadFailure):
+                    raise data.error
+                self._data = data
             return self._data
         else:
             return self
@@ -1166,41 +2115,36 @@ class BaseLoader:
         logging.debug("Resetting the loader")
         if self._exit_event:
             self._exit_event.set()
-        if self._request_task_q:
-            self._request_task_q.put(None)
-        if self._download_task_q:
-            self._download_task_q.put(None)
         if self._read_task_q:
-            while True:
-                try:
-                    self._read_task_q.get(block=False)
-                except Empty:
-                    break
+            self._read_task_q.clear()
             self._read_task_q.put(None)
         if self._data_q:
-            while True:
-                try:
-                    self._data_q.get(block=False)
-                except Empty:
-                    break
+            self._data_q.clear()
         if self._requester:
             self._requester.join()
-        if self._downloader:
-            self._downloader.join()
-        if self._reader:
-            self._reader.join()
-        del self._request_task_q, self._download_task_q, self._read_task_q, self._data_q
+        for downloader in self._downloaders:
+            downloader.join()
+        for reader in self._readers:
+            reader.join()
+        del self._read_task_q, self._data_q
         self._exit_event = None
-        self._requester, self._downloader, self._reader = None, None, None
-        self._request_task_q, self._download_task_q, self._read_task_q, self._data_q = (
-            None,
-            None,
-            None,
-            None,
-        )
+        self._requester, self._downloaders, self._readers = None, [], []
+        self._read_task_q, self._data_q = None, None
+        # Freed batches stay in the per-thread heaps of the C allocator and keep
+        # the process large. Hand that memory back to the OS between epochs.
+        malloc_trim = self._malloc_trim()
+        if malloc_trim is not None:
+            malloc_trim(0)
         if theend:
-            if self._kafka_topic and self._kafka_consumer:
-                self._kafka_consumer.unsubscribe()
+            if self._rest_pool:
+                for response in self._rest_responses:
+                    response.cancel()
+                self._rest_responses.clear()
+                self._rest_pool.shutdown(wait=False)
+                self._rest_pool = None
+            if self._kafka_topic:
+                for consumer in self._kafka_consumers:
+                    consumer.unsubscribe()
             if self.delete_all_topics and self._kafka_admin:
                 topics_to_delete = self._all_kafka_topics.intersection(self._kafka_admin.list_topics())
                 resp = self._kafka_admin.delete_topics(list(topics_to_delete))
@@ -1211,8 +2155,9 @@ class BaseLoader:
                         )
         else:
             if self.delete_epoch_topic and self._kafka_admin:
-                if self._kafka_topic and self._kafka_consumer:
-                    self._kafka_consumer.unsubscribe()
+                if self._kafka_topic:
+                    for consumer in self._kafka_consumers:
+                        consumer.unsubscribe()
                 resp = self._kafka_admin.delete_topics([self._kafka_topic])
                 del_res = resp.to_object()["topic_error_codes"][0]
                 if del_res["error_code"] != 0:
@@ -1285,10 +2230,15 @@ class NeighborLoader(BaseLoader):
         filter_by: Union[str, dict] = None,
         output_format: str = "PyG",
         add_self_loop: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False,
         loader_id: str = None,
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
         kafka_address: str = None,
         kafka_max_msg_size: int = 104857600,
         kafka_num_partitions: int = 1,
@@ -1306,7 +2256,13 @@ class NeighborLoader(BaseLoader):
         kafka_skip_produce: bool = False,
         kafka_auto_offset_reset: str = "earliest",
         kafka_del_topic_per_epoch: bool = False,
-        kafka_add_topic_per_epoch: bool = False
+        kafka_add_topic_per_epoch: bool = False,
+        kafka_fetch_min_bytes: int = 1,
+        kafka_max_poll_records: int = 500,
+        kafka_topic_compression_type: str = None,
+        kafka_fetch_max_wait_ms: int = 200,
+        kafka_fetch_max_bytes: int = None,
+        kafka_max_partition_fetch_bytes: int = None
     ) -> None:
         """NO DOC"""
 
@@ -1318,6 +2274,9 @@ class NeighborLoader(BaseLoader):
             output_format,
             reverse_edge,
             timeout,
+            reader_threads,
+            numa_node,
+            prefetch_depth,
             kafka_address,
             kafka_max_msg_size,
             kafka_num_partitions,
@@ -1335,7 +2294,13 @@ class NeighborLoader(BaseLoader):
             kafka_skip_produce,
             kafka_auto_offset_reset,
             kafka_del_topic_per_epoch,
-            kafka_add_topic_per_epoch
+            kafka_add_topic_per_epoch,
+            kafka_fetch_min_bytes,
+            kafka_max_poll_records,
+            kafka_topic_compression_type,
+            kafka_fetch_max_wait_ms,
+            kafka_fetch_max_bytes,
+            kafka_max_partition_fetch_bytes
         )
         # Resolve attributes
         is_hetero = any(map(lambda x: isinstance(x, dict), 
@@ -1369,32 +2334,14 @@ class NeighborLoader(BaseLoader):
         self._vtypes = sorted(self._vtypes)
         self._etypes = sorted(self._etypes)
         # Resolve seeds
-        if batch_size:
-            # If batch_size is given, calculate the number of batches
-            if not filter_by:
-                self._seed_types = self._vtypes
-                num_vertices = sum(self._graph.getVertexCount(self._seed_types).values())
-            elif isinstance(filter_by, str):
-                self._seed_types = self._vtypes
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by))
-                    for k in self._seed_types
-                )
-            elif isinstance(filter_by, dict):
-                self._seed_types = list(filter_by.keys())
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by[k]))
-                    for k in self._seed_types
-                )
-            else:
-                raise ValueError("filter_by should be None, attribute name, or dict of {type name: attribute name}.")
-            self.num_batches = math.ceil(num_vertices / batch_size)
+        if (not filter_by) or isinstance(filter_by, str):
+            self._seed_types = self._vtypes
+        elif isinstance(filter_by, dict):
+            self._seed_types = list(filter_by.keys())
         else:
-            # Otherwise, take the number of batches as is.
-            self._seed_types = self._vtypes if ((not filter_by) or isinstance(filter_by, str)) else list(filter_by.keys())
-            self.num_batches = num_batches
+            raise ValueError("filter_by should be None, attribute name, or dict of {type name: attribute name}.")
+        self._set_num_batches(num_batches, batch_size, "vertex", self._seed_types, filter_by)
         # Initialize parameters for the query
-        self._payload["num_batches"] = self.num_batches
         self._payload["num_neighbors"] = num_neighbors
         self._payload["num_hops"] = num_hops
         if filter_by:
@@ -1409,8 +2356,18 @@ class NeighborLoader(BaseLoader):
         self._payload["v_types"] = self._vtypes
         self._payload["e_types"] = self._etypes
         self._payload["seed_types"] = self._seed_types
+        # Vertex attribute types including the seed flag. Copied so that the
+        # schema shared with other code is left unchanged.
+        if not self.is_hetero:
+            self._v_attr_types = {**self._homo_v_schema, "is_seed": "bool"}
+        else:
+            self._v_attr_types = {
+                vtype: {**attrs, "is_seed": "bool"} for vtype, attrs in self._v_schema.items()
+            }
         # Output
         self.add_self_loop = add_self_loop
+        self.feature_dtype = self._check_feature_dtype(feature_dtype, output_format)
+        self.pin_memory = pin_memory
         # Install query
         self.query_name = self._install_query()
 
@@ -1430,12 +2387,8 @@ class NeighborLoader(BaseLoader):
                     + self.v_extra_feats.get(vtype, [])
                 )
                 query_suffix.extend(v_attr_names)
-                v_attr_types = self._v_schema[vtype]
                 if v_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(s.{})".format(attr)
-                        for attr in v_attr_names
-                    )
+                    print_attr = self._print_attrs("s", tuple(v_attr_names))
                     print_query_seed += '{} s.type == "{}" THEN \n @@v_batch += (s.type + "," + int_to_string(getvid(s)) + "," + {} + ",1\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", vtype, print_attr)
                     print_query_other += '{} s.type == "{}" THEN \n @@v_batch += (s.type + "," + int_to_string(getvid(s)) + "," + {} + ",0\\n")\n'.format(
@@ -1458,12 +2411,8 @@ class NeighborLoader(BaseLoader):
                     + self.e_extra_feats.get(etype, [])
                 )
                 query_suffix.extend(e_attr_names)
-                e_attr_types = self._e_schema[etype]
                 if e_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(e.{})".format(attr)
-                        for attr in e_attr_names
-                    )
+                    print_attr = self._print_attrs("e", tuple(e_attr_names))
                     print_query += '{} e.type == "{}" THEN \n @@e_batch += (e.type + "," + int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + "\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", etype, print_attr)
                 else:
@@ -1476,12 +2425,8 @@ class NeighborLoader(BaseLoader):
             # Ignore vertex types
             v_attr_names = self.v_in_feats + self.v_out_labels + self.v_extra_feats
             query_suffix.extend(v_attr_names)
-            v_attr_types = next(iter(self._v_schema.values()))
             if v_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(s.{})".format(attr)
-                    for attr in v_attr_names
-                )
+                print_attr = self._print_attrs("s", tuple(v_attr_names))
                 print_query = '@@v_batch += (int_to_string(getvid(s)) + "," + {} + ",1\\n")'.format(
                     print_attr
                 )
@@ -1498,12 +2443,8 @@ class NeighborLoader(BaseLoader):
             # Ignore edge types
             e_attr_names = self.e_in_feats + self.e_out_labels + self.e_extra_feats
             query_suffix.extend(e_attr_names)
-            e_attr_types = next(iter(self._e_schema.values()))
             if e_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(e.{})".format(attr)
-                    for attr in e_attr_names
-                )
+                print_attr = self._print_attrs("e", tuple(e_attr_names))
                 print_query = '@@e_batch += (int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + "\\n")'.format(
                     print_attr
                 )
@@ -1522,8 +2463,8 @@ class NeighborLoader(BaseLoader):
 
     def _start(self) -> None:
         # Create task and result queues
-        self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._read_task_q = _BatchQueue(self.buffer_size * 2)
+        self._data_q = _BatchQueue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(True, "both")
@@ -1531,19 +2472,15 @@ class NeighborLoader(BaseLoader):
         # Start reading thread.
         if not self.is_hetero:
             v_extra_feats = self.v_extra_feats + ["is_seed"]
-            v_attr_types = next(iter(self._v_schema.values()))
-            v_attr_types["is_seed"] = "bool"
-            e_attr_types = next(iter(self._e_schema.values()))
+            v_attr_types = self._v_attr_types
+            e_attr_types = self._homo_e_schema
         else:
             v_extra_feats = {}
             for vtype in self._vtypes:
                 v_extra_feats[vtype] = self.v_extra_feats.get(vtype, []) + ["is_seed"]
-            v_attr_types = self._v_schema
-            for vtype in v_attr_types:
-                v_attr_types[vtype]["is_seed"] = "bool"
+            v_attr_types = self._v_attr_types
             e_attr_types = self._e_schema
-        self._reader = Thread(
-            target=self._read_data,
+        self._start_readers(
             args=(
                 self._exit_event,
                 self._read_task_q,
@@ -1560,10 +2497,11 @@ class NeighborLoader(BaseLoader):
                 e_attr_types,
                 self.add_self_loop,
                 True,
-                self.is_hetero
+                self.is_hetero,
+                self.feature_dtype,
+                self.pin_memory
             ),
         )
-        self._reader.start()
 
     @property
     def data(self) -> Any:
@@ -1588,11 +2526,13 @@ class NeighborLoader(BaseLoader):
             raise ValueError(
                 'Input to fetch() should be in format: [{"primary_id": ..., "type": ...}, ...]'
             )
-        for i in vertices:
-            if not (isinstance(i, dict) and ("primary_id" in i) and ("type" in i)):
-                raise ValueError(
-                    'Input to fetch() should be in format: [{"primary_id": ..., "type": ...}, ...]'
-                )
+        # Validate and convert the input in one pass.
+        try:
+            input_vertices = [(i["primary_id"], i["type"]) for i in vertices]
+        except (KeyError, TypeError, IndexError):
+            raise ValueError(
+                'Input to fetch() should be in format: [{"primary_id": ..., "type": ...}, ...]'
+            )
         # Send request
         _payload = {}
         _payload["v_types"] = self._payload["v_types"]
@@ -1600,27 +2540,21 @@ class NeighborLoader(BaseLoader):
         _payload["num_batches"] = 1
         _payload["num_neighbors"] = self._payload["num_neighbors"]
         _payload["num_hops"] = self._payload["num_hops"]
-        _payload["input_vertices"] = []
-        for i in vertices:
-            _payload["input_vertices"].append((i["primary_id"], i["type"]))
-        resp = self._graph.runInstalledQuery(
-            self.query_name, params=_payload, timeout=self.timeout, usePost=True
-        )
+        _payload["input_vertices"] = input_vertices
+        resp = self._run_query(_payload)
         # Parse data        
         if not self.is_hetero:
             v_extra_feats = self.v_extra_feats + ["is_seed"]
-            v_attr_types = next(iter(self._v_schema.values()))
-            v_attr_types["is_seed"] = "bool"
-            v_attr_types["primary_id"] = "str"
-            e_attr_types = next(iter(self._e_schema.values()))
+            v_attr_types = {**self._v_attr_types, "primary_id": "str"}
+            e_attr_types = self._homo_e_schema
         else:
             v_extra_feats = {}
             for vtype in self._vtypes:
                 v_extra_feats[vtype] = self.v_extra_feats.get(vtype, []) + ["is_seed"]
-            v_attr_types = self._v_schema
-            for vtype in v_attr_types:
-                v_attr_types[vtype]["is_seed"] = "bool"
-                v_attr_types[vtype]["primary_id"] = "str"
+            v_attr_types = {
+                vtype: {**attrs, "primary_id": "str"}
+                for vtype, attrs in self._v_attr_types.items()
+            }
             e_attr_types = self._e_schema
         i = resp[0]
         data = self._parse_data(
@@ -1638,7 +2572,9 @@ class NeighborLoader(BaseLoader):
             add_self_loop = self.add_self_loop,
             reindex = True,
             primary_id = i["pids"],
-            is_hetero = self.is_hetero
+            is_hetero = self.is_hetero,
+            feature_dtype = self.feature_dtype,
+            pin_memory = self.pin_memory
         )
         # Return data
         return data
@@ -1733,6 +2669,9 @@ class EdgeLoader(BaseLoader):
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
         kafka_address: str = None,
         kafka_max_msg_size: int = 104857600,
         kafka_num_partitions: int = 1,
@@ -1750,7 +2689,13 @@ class EdgeLoader(BaseLoader):
         kafka_skip_produce: bool = False,
         kafka_auto_offset_reset: str = "earliest",
         kafka_del_topic_per_epoch: bool = False,
-        kafka_add_topic_per_epoch: bool = False
+        kafka_add_topic_per_epoch: bool = False,
+        kafka_fetch_min_bytes: int = 1,
+        kafka_max_poll_records: int = 500,
+        kafka_topic_compression_type: str = None,
+        kafka_fetch_max_wait_ms: int = 200,
+        kafka_fetch_max_bytes: int = None,
+        kafka_max_partition_fetch_bytes: int = None
     ) -> None:
         """
         NO DOC.
@@ -1763,6 +2708,9 @@ class EdgeLoader(BaseLoader):
             output_format,
             reverse_edge,
             timeout,
+            reader_threads,
+            numa_node,
+            prefetch_depth,
             kafka_address,
             kafka_max_msg_size,
             kafka_num_partitions,
@@ -1780,7 +2728,13 @@ class EdgeLoader(BaseLoader):
             kafka_skip_produce,
             kafka_auto_offset_reset,
             kafka_del_topic_per_epoch,
-            kafka_add_topic_per_epoch
+            kafka_add_topic_per_epoch,
+            kafka_fetch_min_bytes,
+            kafka_max_poll_records,
+            kafka_topic_compression_type,
+            kafka_fetch_max_wait_ms,
+            kafka_fetch_max_bytes,
+            kafka_max_partition_fetch_bytes
         )
         # Resolve attributes
         is_hetero = isinstance(attributes, dict)
@@ -1794,19 +2748,8 @@ class EdgeLoader(BaseLoader):
             self._etypes = list(self._e_schema.keys())
         self._etypes = sorted(self._etypes)
         # Initialize parameters for the query
-        if batch_size:
-            # If batch_size is given, calculate the number of batches
-            if filter_by:
-                # TODO: get edge count with filter
-                raise NotImplementedError
-            else:
-                num_edges = sum(self._graph.getEdgeCount(i) for i in self._etypes)
-            self.num_batches = math.ceil(num_edges / batch_size)
-        else:
-            # Otherwise, take the number of batches as is.
-            self.num_batches = num_batches
+        self._set_num_batches(num_batches, batch_size, "edge", self._etypes, filter_by)
         # Initialize the exporter
-        self._payload["num_batches"] = self.num_batches
         if filter_by:
             self._payload["filter_by"] = filter_by
         self._payload["shuffle"] = shuffle
@@ -1826,12 +2769,8 @@ class EdgeLoader(BaseLoader):
             for idx, etype in enumerate(self._etypes):
                 e_attr_names = self.attributes.get(etype, [])
                 query_suffix.extend(e_attr_names)
-                e_attr_types = self._e_schema[etype]
                 if e_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(e.{})".format(attr)
-                        for attr in e_attr_names
-                    )
+                    print_attr = self._print_attrs("e", tuple(e_attr_names))
                     print_query += '{} e.type == "{}" THEN \n @@e_batch += (e.type + "," + int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + "\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", etype, print_attr)
                 else:
@@ -1844,12 +2783,8 @@ class EdgeLoader(BaseLoader):
             # Ignore edge types
             e_attr_names = self.attributes
             query_suffix.extend(e_attr_names)
-            e_attr_types = next(iter(self._e_schema.values()))
             if e_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(e.{})".format(attr)
-                    for attr in e_attr_names
-                )
+                print_attr = self._print_attrs("e", tuple(e_attr_names))
                 print_query = '@@e_batch += (int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + "\\n")'.format(
                     print_attr
                 )
@@ -1868,19 +2803,18 @@ class EdgeLoader(BaseLoader):
 
     def _start(self) -> None:
         # Create task and result queues
-        self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._read_task_q = _BatchQueue(self.buffer_size * 2)
+        self._data_q = _BatchQueue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(False, "edge")
 
         # Start reading thread.
         if not self.is_hetero:
-            e_attr_types = next(iter(self._e_schema.values()))
+            e_attr_types = self._homo_e_schema
         else:
             e_attr_types = self._e_schema
-        self._reader = Thread(
-            target=self._read_data,
+        self._start_readers(
             args=(
                 self._exit_event,
                 self._read_task_q,
@@ -1900,7 +2834,6 @@ class EdgeLoader(BaseLoader):
                 self.is_hetero
             ),
         )
-        self._reader.start()
 
     @property
     def data(self) -> Any:
@@ -2002,6 +2935,9 @@ class VertexLoader(BaseLoader):
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
         kafka_address: str = None,
         kafka_max_msg_size: int = 104857600,
         kafka_num_partitions: int = 1,
@@ -2019,7 +2955,13 @@ class VertexLoader(BaseLoader):
         kafka_skip_produce: bool = False,
         kafka_auto_offset_reset: str = "earliest",
         kafka_del_topic_per_epoch: bool = False,
-        kafka_add_topic_per_epoch: bool = False
+        kafka_add_topic_per_epoch: bool = False,
+        kafka_fetch_min_bytes: int = 1,
+        kafka_max_poll_records: int = 500,
+        kafka_topic_compression_type: str = None,
+        kafka_fetch_max_wait_ms: int = 200,
+        kafka_fetch_max_bytes: int = None,
+        kafka_max_partition_fetch_bytes: int = None
     ) -> None:
         """
         NO DOC
@@ -2032,6 +2974,9 @@ class VertexLoader(BaseLoader):
             output_format,
             reverse_edge,
             timeout,
+            reader_threads,
+            numa_node,
+            prefetch_depth,
             kafka_address,
             kafka_max_msg_size,
             kafka_num_partitions,
@@ -2049,7 +2994,13 @@ class VertexLoader(BaseLoader):
             kafka_skip_produce,
             kafka_auto_offset_reset,
             kafka_del_topic_per_epoch,
-            kafka_add_topic_per_epoch
+            kafka_add_topic_per_epoch,
+            kafka_fetch_min_bytes,
+            kafka_max_poll_records,
+            kafka_topic_compression_type,
+            kafka_fetch_max_wait_ms,
+            kafka_fetch_max_bytes,
+            kafka_max_partition_fetch_bytes
         )
         # Resolve attributes
         is_hetero = isinstance(attributes, dict)
@@ -2063,21 +3014,7 @@ class VertexLoader(BaseLoader):
             self._vtypes = list(self._v_schema.keys())
         self._vtypes = sorted(self._vtypes)
         # Initialize parameters for the query
-        if batch_size:
-            # If batch_size is given, calculate the number of batches
-            num_vertices_by_type = self._graph.getVertexCount(self._vtypes)
-            if filter_by:
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by))
-                    for k in num_vertices_by_type
-                )
-            else:
-                num_vertices = sum(num_vertices_by_type.values())
-            self.num_batches = math.ceil(num_vertices / batch_size)
-        else:
-            # Otherwise, take the number of batches as is.
-            self.num_batches = num_batches
-        self._payload["num_batches"] = self.num_batches
+        self._set_num_batches(num_batches, batch_size, "vertex", self._vtypes, filter_by)
         if filter_by:
             self._payload["filter_by"] = filter_by
         self._payload["shuffle"] = shuffle
@@ -2096,12 +3033,8 @@ class VertexLoader(BaseLoader):
             for idx, vtype in enumerate(self._vtypes):
                 v_attr_names = self.attributes.get(vtype, [])
                 query_suffix.extend(v_attr_names)
-                v_attr_types = self._v_schema[vtype]
                 if v_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(s.{})".format(attr)
-                        for attr in v_attr_names
-                    )
+                    print_attr = self._print_attrs("s", tuple(v_attr_names))
                     print_query += '{} s.type == "{}" THEN \n @@v_batch += (s.type + "," + int_to_string(getvid(s)) + "," + {} + "\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", vtype, print_attr)
                 else:
@@ -2114,12 +3047,8 @@ class VertexLoader(BaseLoader):
             # Ignore vertex types
             v_attr_names = self.attributes
             query_suffix.extend(v_attr_names)
-            v_attr_types = next(iter(self._v_schema.values()))
             if v_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(s.{})".format(attr)
-                    for attr in v_attr_names
-                )
+                print_attr = self._print_attrs("s", tuple(v_attr_names))
                 print_query = '@@v_batch += (int_to_string(getvid(s)) + "," + {} + "\\n")'.format(
                     print_attr
                 )
@@ -2138,19 +3067,18 @@ class VertexLoader(BaseLoader):
 
     def _start(self) -> None:
         # Create task and result queues
-        self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._read_task_q = _BatchQueue(self.buffer_size * 2)
+        self._data_q = _BatchQueue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(False, "vertex")
             
         # Start reading thread.
         if not self.is_hetero:
-            v_attr_types = next(iter(self._v_schema.values()))
+            v_attr_types = self._homo_v_schema
         else:
             v_attr_types = self._v_schema
-        self._reader = Thread(
-            target=self._read_data,
+        self._start_readers(
             args=(
                 self._exit_event,
                 self._read_task_q,
@@ -2170,7 +3098,6 @@ class VertexLoader(BaseLoader):
                 self.is_hetero
             ),
         )
-        self._reader.start()
 
     @property
     def data(self) -> Any:
@@ -2274,10 +3201,15 @@ class GraphLoader(BaseLoader):
         filter_by: str = None,
         output_format: str = "PyG",
         add_self_loop: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False,
         loader_id: str = None,
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
         kafka_address: str = None,
         kafka_max_msg_size: int = 104857600,
         kafka_num_partitions: int = 1,
@@ -2295,7 +3227,13 @@ class GraphLoader(BaseLoader):
         kafka_skip_produce: bool = False,
         kafka_auto_offset_reset: str = "earliest",
         kafka_del_topic_per_epoch: bool = False,
-        kafka_add_topic_per_epoch: bool = False
+        kafka_add_topic_per_epoch: bool = False,
+        kafka_fetch_min_bytes: int = 1,
+        kafka_max_poll_records: int = 500,
+        kafka_topic_compression_type: str = None,
+        kafka_fetch_max_wait_ms: int = 200,
+        kafka_fetch_max_bytes: int = None,
+        kafka_max_partition_fetch_bytes: int = None
     ) -> None:
         """
         NO DOC
@@ -2308,6 +3246,9 @@ class GraphLoader(BaseLoader):
             output_format,
             reverse_edge,
             timeout,
+            reader_threads,
+            numa_node,
+            prefetch_depth,
             kafka_address,
             kafka_max_msg_size,
             kafka_num_partitions,
@@ -2325,7 +3266,13 @@ class GraphLoader(BaseLoader):
             kafka_skip_produce,
             kafka_auto_offset_reset,
             kafka_del_topic_per_epoch,
-            kafka_add_topic_per_epoch
+            kafka_add_topic_per_epoch,
+            kafka_fetch_min_bytes,
+            kafka_max_poll_records,
+            kafka_topic_compression_type,
+            kafka_fetch_max_wait_ms,
+            kafka_fetch_max_bytes,
+            kafka_max_partition_fetch_bytes
         )
         # Resolve attributes
         is_hetero = any(map(lambda x: isinstance(x, dict), 
@@ -2359,18 +3306,7 @@ class GraphLoader(BaseLoader):
         self._vtypes = sorted(self._vtypes)
         self._etypes = sorted(self._etypes)
         # Initialize parameters for the query
-        if batch_size:
-            # If batch_size is given, calculate the number of batches
-            if filter_by:
-                # TODO: get edge count with filter
-                raise NotImplementedError
-            else:
-                num_edges = sum(self._graph.getEdgeCount(i) for i in self._etypes)
-            self.num_batches = math.ceil(num_edges / batch_size)
-        else:
-            # Otherwise, take the number of batches as is.
-            self.num_batches = num_batches
-        self._payload["num_batches"] = self.num_batches
+        self._set_num_batches(num_batches, batch_size, "edge", self._etypes, filter_by)
         if filter_by:
             self._payload["filter_by"] = filter_by
         self._payload["shuffle"] = shuffle
@@ -2378,6 +3314,8 @@ class GraphLoader(BaseLoader):
         self._payload["e_types"] = self._etypes
         # Output
         self.add_self_loop = add_self_loop
+        self.feature_dtype = self._check_feature_dtype(feature_dtype, output_format)
+        self.pin_memory = pin_memory
         # Install query
         self.query_name = self._install_query()
 
@@ -2396,12 +3334,8 @@ class GraphLoader(BaseLoader):
                     + self.v_extra_feats.get(vtype, [])
                 )
                 query_suffix.extend(v_attr_names)
-                v_attr_types = self._v_schema[vtype]
                 if v_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(s.{})".format(attr)
-                        for attr in v_attr_names
-                    )
+                    print_attr = self._print_attrs("s", tuple(v_attr_names))
                     print_query += '{} s.type == "{}" THEN \n @@v_batch += (s.type + "," + int_to_string(getvid(s)) + "," + {} + "\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", vtype, print_attr)
                 else:
@@ -2418,12 +3352,8 @@ class GraphLoader(BaseLoader):
                     + self.e_extra_feats.get(etype, [])
                 )
                 query_suffix.extend(e_attr_names)
-                e_attr_types = self._e_schema[etype]
                 if e_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(e.{})".format(attr)
-                        for attr in e_attr_names
-                    )
+                    print_attr = self._print_attrs("e", tuple(e_attr_names))
                     print_query += '{} e.type == "{}" THEN \n @@e_batch += (e.type + "," + int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + "\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", etype, print_attr)
                 else:
@@ -2436,12 +3366,8 @@ class GraphLoader(BaseLoader):
             # Ignore vertex types
             v_attr_names = self.v_in_feats + self.v_out_labels + self.v_extra_feats
             query_suffix.extend(v_attr_names)
-            v_attr_types = next(iter(self._v_schema.values()))
             if v_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(s.{})".format(attr)
-                    for attr in v_attr_names
-                )
+                print_attr = self._print_attrs("s", tuple(v_attr_names))
                 print_query = '@@v_batch += (int_to_string(getvid(s)) + "," + {} + "\\n")'.format(
                     print_attr
                 )
@@ -2451,12 +3377,8 @@ class GraphLoader(BaseLoader):
             # Ignore edge types
             e_attr_names = self.e_in_feats + self.e_out_labels + self.e_extra_feats
             query_suffix.extend(e_attr_names)
-            e_attr_types = next(iter(self._e_schema.values()))
             if e_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(e.{})".format(attr)
-                    for attr in e_attr_names
-                )
+                print_attr = self._print_attrs("e", tuple(e_attr_names))
                 print_query = '@@e_batch += (int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + "\\n")'.format(
                     print_attr
                 )
@@ -2475,21 +3397,20 @@ class GraphLoader(BaseLoader):
 
     def _start(self) -> None:
         # Create task and result queues
-        self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._read_task_q = _BatchQueue(self.buffer_size * 2)
+        self._data_q = _BatchQueue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(True, "both")
 
         # Start reading thread.
         if not self.is_hetero:
-            v_attr_types = next(iter(self._v_schema.values()))
-            e_attr_types = next(iter(self._e_schema.values()))
+            v_attr_types = self._homo_v_schema
+            e_attr_types = self._homo_e_schema
         else:
             v_attr_types = self._v_schema
             e_attr_types = self._e_schema
-        self._reader = Thread(
-            target=self._read_data,
+        self._start_readers(
             args=(
                 self._exit_event,
                 self._read_task_q,
@@ -2506,10 +3427,11 @@ class GraphLoader(BaseLoader):
                 e_attr_types,
                 self.add_self_loop,
                 True,
-                self.is_hetero
+                self.is_hetero,
+                self.feature_dtype,
+                self.pin_memory
             ),
         )
-        self._reader.start()
 
     @property
     def data(self) -> Any:
@@ -2569,10 +3491,15 @@ class EdgeNeighborLoader(BaseLoader):
         filter_by: Union[str, dict] = None,
         output_format: str = "PyG",
         add_self_loop: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False,
         loader_id: str = None,
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
         kafka_address: str = None,
         kafka_max_msg_size: int = 104857600,
         kafka_num_partitions: int = 1,
@@ -2590,7 +3517,13 @@ class EdgeNeighborLoader(BaseLoader):
         kafka_skip_produce: bool = False,
         kafka_auto_offset_reset: str = "earliest",
         kafka_del_topic_per_epoch: bool = False,
-        kafka_add_topic_per_epoch: bool = False
+        kafka_add_topic_per_epoch: bool = False,
+        kafka_fetch_min_bytes: int = 1,
+        kafka_max_poll_records: int = 500,
+        kafka_topic_compression_type: str = None,
+        kafka_fetch_max_wait_ms: int = 200,
+        kafka_fetch_max_bytes: int = None,
+        kafka_max_partition_fetch_bytes: int = None
     ) -> None:
         """NO DOC"""
 
@@ -2602,6 +3535,9 @@ class EdgeNeighborLoader(BaseLoader):
             output_format,
             reverse_edge,
             timeout,
+            reader_threads,
+            numa_node,
+            prefetch_depth,
             kafka_address,
             kafka_max_msg_size,
             kafka_num_partitions,
@@ -2619,7 +3555,13 @@ class EdgeNeighborLoader(BaseLoader):
             kafka_skip_produce,
             kafka_auto_offset_reset,
             kafka_del_topic_per_epoch,
-            kafka_add_topic_per_epoch
+            kafka_add_topic_per_epoch,
+            kafka_fetch_min_bytes,
+            kafka_max_poll_records,
+            kafka_topic_compression_type,
+            kafka_fetch_max_wait_ms,
+            kafka_fetch_max_bytes,
+            kafka_max_partition_fetch_bytes
         )
         # Resolve attributes
         is_hetero = any(map(lambda x: isinstance(x, dict), 
@@ -2655,19 +3597,8 @@ class EdgeNeighborLoader(BaseLoader):
         # Resolve seeds
         self._seed_types = self._etypes if ((not filter_by) or isinstance(filter_by, str)) else list(filter_by.keys())
         # Resolve number of batches
-        if batch_size:
-            # If batch_size is given, calculate the number of batches
-            if filter_by:
-                # TODO: get edge count with filter
-                raise NotImplementedError("Cannot specify batch_size and filter_by at the same time. Please use num_batches and filter_by.")
-            else:
-                num_edges = sum(self._graph.getEdgeCount(i) for i in self._etypes)
-            self.num_batches = math.ceil(num_edges / batch_size)
-        else:
-            # Otherwise, take the number of batches as is.
-            self.num_batches = num_batches
+        self._set_num_batches(num_batches, batch_size, "edge", self._etypes, filter_by)
         # Initialize parameters for the query
-        self._payload["num_batches"] = self.num_batches
         self._payload["num_neighbors"] = num_neighbors
         self._payload["num_hops"] = num_hops
         if filter_by:
@@ -2682,8 +3613,18 @@ class EdgeNeighborLoader(BaseLoader):
         self._payload["v_types"] = self._vtypes
         self._payload["e_types"] = self._etypes
         self._payload["seed_types"] = self._seed_types
+        # Edge attribute types including the seed flag. Copied so that the
+        # schema shared with other code is left unchanged.
+        if not self.is_hetero:
+            self._e_attr_types = {**self._homo_e_schema, "is_seed": "bool"}
+        else:
+            self._e_attr_types = {
+                etype: {**attrs, "is_seed": "bool"} for etype, attrs in self._e_schema.items()
+            }
         # Output
         self.add_self_loop = add_self_loop
+        self.feature_dtype = self._check_feature_dtype(feature_dtype, output_format)
+        self.pin_memory = pin_memory
         # Install query
         self.query_name = self._install_query()
 
@@ -2702,12 +3643,8 @@ class EdgeNeighborLoader(BaseLoader):
                     + self.v_extra_feats.get(vtype, [])
                 )
                 query_suffix.extend(v_attr_names)
-                v_attr_types = self._v_schema[vtype]
                 if v_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(s.{})".format(attr)
-                        for attr in v_attr_names
-                    )
+                    print_attr = self._print_attrs("s", tuple(v_attr_names))
                     print_query += '{} s.type == "{}" THEN \n @@v_batch += (s.type + "," + int_to_string(getvid(s)) + "," + {} + "\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", vtype, print_attr)
                 else:
@@ -2725,12 +3662,8 @@ class EdgeNeighborLoader(BaseLoader):
                     + self.e_extra_feats.get(etype, [])
                 )
                 query_suffix.extend(e_attr_names)
-                e_attr_types = self._e_schema[etype]
                 if e_attr_names:
-                    print_attr = '+","+'.join(
-                        "stringify(e.{})".format(attr)
-                        for attr in e_attr_names
-                    )
+                    print_attr = self._print_attrs("e", tuple(e_attr_names))
                     print_query_seed += '{} e.type == "{}" THEN \n @@e_batch += (e.type + "," + int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + ",1\\n")\n'.format(
                             "IF" if idx==0 else "ELSE IF", etype, print_attr)
                     print_query_other += '{} e.type == "{}" THEN \n @@e_batch += (e.type + "," + int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + ",0\\n")\n'.format(
@@ -2749,12 +3682,8 @@ class EdgeNeighborLoader(BaseLoader):
             # Ignore vertex types
             v_attr_names = self.v_in_feats + self.v_out_labels + self.v_extra_feats
             query_suffix.extend(v_attr_names)
-            v_attr_types = next(iter(self._v_schema.values()))
             if v_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(s.{})".format(attr)
-                    for attr in v_attr_names
-                )
+                print_attr = self._print_attrs("s", tuple(v_attr_names))
                 print_query = '@@v_batch += (int_to_string(getvid(s)) + "," + {} + "\\n")'.format(
                     print_attr
                 )
@@ -2765,12 +3694,8 @@ class EdgeNeighborLoader(BaseLoader):
             # Ignore edge types
             e_attr_names = self.e_in_feats + self.e_out_labels + self.e_extra_feats
             query_suffix.extend(e_attr_names)
-            e_attr_types = next(iter(self._e_schema.values()))
             if e_attr_names:
-                print_attr = '+","+'.join(
-                    "stringify(e.{})".format(attr)
-                    for attr in e_attr_names
-                )
+                print_attr = self._print_attrs("e", tuple(e_attr_names))
                 print_query = '@@e_batch += (int_to_string(getvid(s)) + "," + int_to_string(getvid(t)) + "," + {} + ",1\\n")'.format(
                     print_attr
                 )
@@ -2796,8 +3721,8 @@ class EdgeNeighborLoader(BaseLoader):
 
     def _start(self) -> None:
         # Create task and result queues
-        self._read_task_q = Queue(self.buffer_size * 2)
-        self._data_q = Queue(self.buffer_size)
+        self._read_task_q = _BatchQueue(self.buffer_size * 2)
+        self._data_q = _BatchQueue(self.buffer_size)
         self._exit_event = Event()
 
         self._start_request(True, "both")
@@ -2805,19 +3730,15 @@ class EdgeNeighborLoader(BaseLoader):
         # Start reading thread.
         if not self.is_hetero:
             e_extra_feats = self.e_extra_feats + ["is_seed"]
-            e_attr_types = next(iter(self._e_schema.values()))
-            e_attr_types["is_seed"] = "bool"
-            v_attr_types = next(iter(self._v_schema.values()))
+            e_attr_types = self._e_attr_types
+            v_attr_types = self._homo_v_schema
         else:
             e_extra_feats = {}
             for etype in self._etypes:
                 e_extra_feats[etype] = self.e_extra_feats.get(etype, []) + ["is_seed"]
-            e_attr_types = self._e_schema
-            for etype in e_attr_types:
-                e_attr_types[etype]["is_seed"] = "bool"
+            e_attr_types = self._e_attr_types
             v_attr_types = self._v_schema
-        self._reader = Thread(
-            target=self._read_data,
+        self._start_readers(
             args=(
                 self._exit_event,
                 self._read_task_q,
@@ -2834,10 +3755,11 @@ class EdgeNeighborLoader(BaseLoader):
                 e_attr_types,
                 self.add_self_loop,
                 True,
-                self.is_hetero
+                self.is_hetero,
+                self.feature_dtype,
+                self.pin_memory
             ),
         )
-        self._reader.start()
 
     @property
     def data(self) -> Any:
@@ -70,7 +70,13 @@ class GDS:
         kafka_skip_produce: bool = False,
         kafka_auto_offset_reset: str = "earliest",
         kafka_del_topic_per_epoch: bool = False,
-        kafka_add_topic_per_epoch: bool = False
+        kafka_add_topic_per_epoch: bool = False,
+        kafka_fetch_min_bytes: int = 1,
+        kafka_max_poll_records: int = 500,
+        kafka_topic_compression_type: str = None,
+        kafka_fetch_max_wait_ms: int = 200,
+        kafka_fetch_max_bytes: int = None,
+        kafka_max_partition_fetch_bytes: int = None
     ) -> None:
         """Configure the Kafka connection.
         Args:
@@ -80,7 +86,8 @@ class GDS:
                 Maximum size of a Kafka message in bytes.
                 Defaults to 104857600.
             kafka_num_partitions (int, optional):
-                Number of partitions for the topic created by this loader.
+                Number of partitions for the topic created by this loader. With more
+                than one, each partition is downloaded by its own consumer thread.
                 Defaults to 1.
             kafka_replica_factor (int, optional):
                 Number of replications for the topic created by this
@@ -120,6 +127,34 @@ class GDS:
                 `kafka_add_topic_per_epoch` is True. Defaults to False.
             kafka_add_topic_per_epoch (bool, optional):  
                 Whether to add a topic for each epoch. Defaults to False.
+            kafka_fetch_min_bytes (int, optional):
+                Minimum amount of data in bytes the broker should return for a fetch
+                request. Raising it makes the consumer wait for more batches per
+                round trip. Defaults to 1.
+            kafka_max_poll_records (int, optional):
+                Maximum number of messages returned by a single poll of the consumer.
+                Defaults to 500.
+            kafka_topic_compression_type (str, optional):
+                Compression type of the topic created by this loader, e.g., "zstd",
+                "lz4", "snappy" or "gzip". The CSV batches compress well, and "zstd"
+                usually gives the smallest transfers. The consumer needs the matching
+                Python package (`zstandard`, `lz4` or `python-snappy`) to decompress
+                messages. Note that `kafka_max_msg_size` limits the compressed size.
+                The loader queries send each batch as a single message through the
+                `write_to_kafka` UDF, so producer batching (`linger.ms`, `batch.size`)
+                has nothing to combine, and the topic is where compression is set.
+                Defaults to None, which keeps the broker default.
+            kafka_fetch_max_wait_ms (int, optional):
+                Longest time in milliseconds the broker waits for `kafka_fetch_min_bytes` of
+                data before answering a fetch. Lower values return the first batches sooner
+                while the query is still producing them. Defaults to 200.
+            kafka_fetch_max_bytes (int, optional):
+                Maximum amount of data in bytes the broker returns for one fetch request
+                across all partitions. A batch larger than this is still returned on its own.
+                Defaults to None, which uses `kafka_max_msg_size`.
+            kafka_max_partition_fetch_bytes (int, optional):
+                Maximum amount of data in bytes the broker returns per partition for one
+                fetch request. Defaults to None, which uses `kafka_max_msg_size`.
         """
         self.kafkaConfig = {
             "kafka_address": kafka_address,
@@ -139,7 +174,13 @@ class GDS:
             "kafka_skip_produce": kafka_skip_produce,
             "kafka_auto_offset_reset": kafka_auto_offset_reset,
             "kafka_del_topic_per_epoch": kafka_del_topic_per_epoch,
-            "kafka_add_topic_per_epoch": kafka_add_topic_per_epoch
+            "kafka_add_topic_per_epoch": kafka_add_topic_per_epoch,
+            "kafka_fetch_min_bytes": kafka_fetch_min_bytes,
+            "kafka_max_poll_records": kafka_max_poll_records,
+            "kafka_topic_compression_type": kafka_topic_compression_type,
+            "kafka_fetch_max_wait_ms": kafka_fetch_max_wait_ms,
+            "kafka_fetch_max_bytes": kafka_fetch_max_bytes,
+            "kafka_max_partition_fetch_bytes": kafka_max_partition_fetch_bytes
         }
 
 
@@ -160,10 +201,15 @@ class GDS:
         filter_by: str = None,
         output_format: str = "PyG",
         add_self_loop: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False,
         loader_id: str = None,
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
     ) -> NeighborLoader:
         """Returns a `NeighborLoader` instance.
         A `NeighborLoader` instance performs neighbor sampling from vertices in the graph in batches in the following manner:
@@ -269,6 +315,18 @@ class GDS:
                 "PyG", "DGL", "spektral", and "dataframe" are supported. Defaults to "PyG".
             add_self_loop (bool, optional):
                 Whether to add self-loops to the graph. Defaults to False.
+            feature_dtype (str, optional):
+                Data type to cast floating-point input features (`v_in_feats` and `e_in_feats`)
+                to, e.g., "float16" or "bfloat16" for mixed precision training. "bfloat16" is
+                only supported by PyG and DGL output. "int8" quantizes them with one symmetric
+                scale per feature column, which is stored as `<feature name>_scale` (in
+                `extra_data` for DGL), e.g. `x_scale`, so that `x * x_scale` recovers the
+                features. Scales are computed per batch. Defaults to None, which keeps the
+                types of the attributes.
+            pin_memory (bool, optional):
+                Whether to put PyG and DGL output in page-locked memory, so that it can be
+                copied to the GPU asynchronously with `.to(device, non_blocking=True)`.
+                Defaults to False.
             loader_id (str, optional):
                 An identifier of the loader which can be any string. It is
                 also used as the Kafka topic name. If `None`, a random string will be generated
@@ -279,6 +337,18 @@ class GDS:
                 Whether to traverse along reverse edge types. Defaults to False.
             timeout (int, optional):
                 Timeout value for GSQL queries, in ms. Defaults to 300000.
+            reader_threads (int, optional):
+                Number of threads parsing raw data into the output format. Batches
+                may come out of order with more than one thread. Defaults to 1.
+            numa_node (int, optional):
+                NUMA node to pin the loader's threads to, so that they and the memory
+                they allocate stay on one socket. Only supported on Linux. Defaults to
+                None (no pinning).
+            prefetch_depth (int, optional):
+                Number of upcoming epochs to request in the background when data is loaded
+                through the REST API, so that the next epoch's query runs while the current
+                one is consumed. Each prefetched epoch is held in memory until it is used.
+                Defaults to 0 (no prefetching).
         """
         params = {
             "graph": self.conn,
@@ -296,10 +366,15 @@ class GDS:
             "filter_by": filter_by,
             "output_format": output_format,
             "add_self_loop": add_self_loop,
+            "feature_dtype": feature_dtype,
+            "pin_memory": pin_memory,
             "loader_id": loader_id,
             "buffer_size": buffer_size,
             "reverse_edge": reverse_edge,
             "timeout": timeout,
+            "reader_threads": reader_threads,
+            "numa_node": numa_node,
+            "prefetch_depth": prefetch_depth,
         }
 
         if self.kafkaConfig:
@@ -320,6 +395,9 @@ class GDS:
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
     ) -> EdgeLoader:
         """Returns an `EdgeLoader` instance. 
         An `EdgeLoader` instance loads all edges in the graph in batches.
@@ -381,6 +459,18 @@ class GDS:
                 Whether to traverse along reverse edge types. Defaults to False.
             timeout (int, optional):
                 Timeout value for GSQL queries, in ms. Defaults to 300000.
+            reader_threads (int, optional):
+                Number of threads parsing raw data into the output format. Batches
+                may come out of order with more than one thread. Defaults to 1.
+            numa_node (int, optional):
+                NUMA node to pin the loader's threads to, so that they and the memory
+                they allocate stay on one socket. Only supported on Linux. Defaults to
+                None (no pinning).
+            prefetch_depth (int, optional):
+                Number of upcoming epochs to request in the background when data is loaded
+                through the REST API, so that the next epoch's query runs while the current
+                one is consumed. Each prefetched epoch is held in memory until it is used.
+                Defaults to 0 (no prefetching).
 
         See https://github.com/TigerGraph-DevLabs/mlworkbench-docs/blob/1.0/tutorials/basics/3_edgeloader.ipynb[the ML Workbench edge loader tutorial notebook]
         for examples.
@@ -397,6 +487,9 @@ class GDS:
             "buffer_size": buffer_size,
             "reverse_edge": reverse_edge,
             "timeout": timeout,
+            "reader_threads": reader_threads,
+            "numa_node": numa_node,
+            "prefetch_depth": prefetch_depth,
         }
         if self.kafkaConfig:
             params.update(self.kafkaConfig)
@@ -416,6 +509,9 @@ class GDS:
             buffer_size: int = 4,
             reverse_edge: bool = False,
             timeout: int = 300000,
+            reader_threads: int = 1,
+            numa_node: int = None,
+            prefetch_depth: int = 0,
     ) -> VertexLoader:
         """Returns a `VertexLoader` instance.
         A `VertexLoader` can load all vertices of a graph in batches.
@@ -477,6 +573,18 @@ class GDS:
                 Whether to traverse along reverse edge types. Defaults to False.
             timeout (int, optional):
                 Timeout value for GSQL queries, in ms. Defaults to 300000.
+            reader_threads (int, optional):
+                Number of threads parsing raw data into the output format. Batches
+                may come out of order with more than one thread. Defaults to 1.
+            numa_node (int, optional):
+                NUMA node to pin the loader's threads to, so that they and the memory
+                they allocate stay on one socket. Only supported on Linux. Defaults to
+                None (no pinning).
+            prefetch_depth (int, optional):
+                Number of upcoming epochs to request in the background when data is loaded
+                through the REST API, so that the next epoch's query runs while the current
+                one is consumed. Each prefetched epoch is held in memory until it is used.
+                Defaults to 0 (no prefetching).
 
         See https://github.com/TigerGraph-DevLabs/mlworkbench-docs/blob/1.0/tutorials/basics/3_vertexloader.ipynb[the ML Workbench tutorial notebook]
         for examples.
@@ -493,6 +601,9 @@ class GDS:
             "buffer_size": buffer_size,
             "reverse_edge": reverse_edge,
             "timeout": timeout,
+            "reader_threads": reader_threads,
+            "numa_node": numa_node,
+            "prefetch_depth": prefetch_depth,
         }
 
         if self.kafkaConfig:
@@ -515,10 +626,15 @@ class GDS:
         filter_by: str = None,
         output_format: str = "PyG",
         add_self_loop: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False,
         loader_id: str = None,
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
     ) -> GraphLoader:
         """Returns a `GraphLoader`instance.
         A `GraphLoader` instance loads all edges from the graph in batches, along with the vertices that are connected with each edge.
@@ -614,6 +730,18 @@ class GDS:
                 Only "PyG", "DGL", "spektral", and "dataframe" are supported. Defaults to "dataframe".
             add_self_loop (bool, optional):
                 Whether to add self-loops to the graph. Defaults to False.
+            feature_dtype (str, optional):
+                Data type to cast floating-point input features (`v_in_feats` and `e_in_feats`)
+                to, e.g., "float16" or "bfloat16" for mixed precision training. "bfloat16" is
+                only supported by PyG and DGL output. "int8" quantizes them with one symmetric
+                scale per feature column, which is stored as `<feature name>_scale` (in
+                `extra_data` for DGL), e.g. `x_scale`, so that `x * x_scale` recovers the
+                features. Scales are computed per batch. Defaults to None, which keeps the
+                types of the attributes.
+            pin_memory (bool, optional):
+                Whether to put PyG and DGL output in page-locked memory, so that it can be
+                copied to the GPU asynchronously with `.to(device, non_blocking=True)`.
+                Defaults to False.
             loader_id (str, optional):
                 An identifier of the loader which can be any string. It is
                 also used as the Kafka topic name. If `None`, a random string will be generated
@@ -624,6 +752,18 @@ class GDS:
                 Whether to traverse along reverse edge types. Defaults to False.
             timeout (int, optional):
                 Timeout value for GSQL queries, in ms. Defaults to 300000.
+            reader_threads (int, optional):
+                Number of threads parsing raw data into the output format. Batches
+                may come out of order with more than one thread. Defaults to 1.
+            numa_node (int, optional):
+                NUMA node to pin the loader's threads to, so that they and the memory
+                they allocate stay on one socket. Only supported on Linux. Defaults to
+                None (no pinning).
+            prefetch_depth (int, optional):
+                Number of upcoming epochs to request in the background when data is loaded
+                through the REST API, so that the next epoch's query runs while the current
+                one is consumed. Each prefetched epoch is held in memory until it is used.
+                Defaults to 0 (no prefetching).
 
         See https://github.com/TigerGraph-DevLabs/mlworkbench-docs/blob/1.0/tutorials/basics/3_graphloader.ipynb[the ML Workbench tutorial notebook for graph loaders]
          for examples.
@@ -642,10 +782,15 @@ class GDS:
             "filter_by": filter_by,
             "output_format": output_format,
             "add_self_loop": add_self_loop,
+            "feature_dtype": feature_dtype,
+            "pin_memory": pin_memory,
             "loader_id": loader_id,
             "buffer_size": buffer_size,
             "reverse_edge": reverse_edge,
             "timeout": timeout,
+            "reader_threads": reader_threads,
+            "numa_node": numa_node,
+            "prefetch_depth": prefetch_depth,
         }
 
         if self.kafkaConfig:
@@ -670,10 +815,15 @@ class GDS:
         filter_by: str = None,
         output_format: str = "PyG",
         add_self_loop: bool = False,
+        feature_dtype: str = None,
+        pin_memory: bool = False,
         loader_id: str = None,
         buffer_size: int = 4,
         reverse_edge: bool = False,
         timeout: int = 300000,
+        reader_threads: int = 1,
+        numa_node: int = None,
+        prefetch_depth: int = 0,
     ) -> EdgeNeighborLoader:
         """Returns an `EdgeNeighborLoader` instance.
         An `EdgeNeighborLoader` instance performs neighbor sampling from all edges in the graph in batches in the following manner:
@@ -779,6 +929,18 @@ class GDS:
                 "PyG", "DGL", "Spektral", and "dataframe" are supported. Defaults to "PyG".
             add_self_loop (bool, optional):
                 Whether to add self-loops to the graph. Defaults to False.
+            feature_dtype (str, optional):
+                Data type to cast floating-point input features (`v_in_feats` and `e_in_feats`)
+                to, e.g., "float16" or "bfloat16" for mixed precision training. "bfloat16" is
+                only supported by PyG and DGL output. "int8" quantizes them with one symmetric
+                scale per feature column, which is stored as `<feature name>_scale` (in
+                `extra_data` for DGL), e.g. `x_scale`, so that `x * x_scale` recovers the
+                features. Scales are computed per batch. Defaults to None, which keeps the
+                types of the attributes.
+            pin_memory (bool, optional):
+                Whether to put PyG and DGL output in page-locked memory, so that it can be
+                copied to the GPU asynchronously with `.to(device, non_blocking=True)`.
+                Defaults to False.
             loader_id (str, optional):
                 An identifier of the loader which can be any string. It is
                 also used as the Kafka topic name. If `None`, a random string will be generated
@@ -789,6 +951,18 @@ class GDS:
                 Whether to traverse along reverse edge types. Defaults to False.
             timeout (int, optional):
                 Timeout value for GSQL queries, in ms. Defaults to 300000.
+            reader_threads (int, optional):
+                Number of threads parsing raw data into the output format. Batches
+                may come out of order with more than one thread. Defaults to 1.
+            numa_node (int, optional):
+                NUMA node to pin the loader's threads to, so that they and the memory
+                they allocate stay on one socket. Only supported on Linux. Defaults to
+                None (no pinning).
+            prefetch_depth (int, optional):
+                Number of upcoming epochs to request in the background when data is loaded
+                through the REST API, so that the next epoch's query runs while the current
+                one is consumed. Each prefetched epoch is held in memory until it is used.
+                Defaults to 0 (no prefetching).
         """
 
         params = {
@@ -807,10 +981,15 @@ class GDS:
             "filter_by": filter_by,
             "output_format": output_format,
             "add_self_loop": add_self_loop,
+            "feature_dtype": feature_dtype,
+            "pin_memory": pin_memory,
             "loader_id": loader_id,
             "buffer_size": buffer_size,
             "reverse_edge": reverse_edge,
             "timeout": timeout,
+            "reader_threads": reader_threads,
+            "numa_node": numa_node,
+            "prefetch_depth": prefetch_depth,
         }
 
         if self.kafkaConfig:
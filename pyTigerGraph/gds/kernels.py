@@ -0,0 +1,230 @@
+"""GDS Kernels
+Optional Numba-compiled helpers for parsing data in the data loaders.
+Every function returns None when Numba is not installed, so that callers
+can fall back to their NumPy or pandas implementation.
+"""
+from functools import lru_cache
+from typing import Tuple, Union
+
+import numpy as np
+
+# Powers of ten that are exact doubles, for the correctly rounded fast path of float parsing.
+_EXACT_POW10 = np.array([float("1e{}".format(i)) for i in range(23)])
+_MAX_EXACT_MANTISSA = 1 << 53
+
+
+def _as_buffer(raw: Union[str, bytes]) -> np.ndarray:
+    # Bytes are used in place. Strings have to be encoded first.
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    return np.frombuffer(raw, dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def _compile_int_parser():
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(nogil=True)
+    def count_fields(buf):
+        n = 1
+        for c in buf:
+            if c == 44 or c == 10:  # "," or "\n"
+                n += 1
+        return n
+
+    @numba.njit(nogil=True)
+    def parse_ints(buf, out):
+        n, val, digits, neg = 0, 0, 0, False
+        for c in buf:
+            if 48 <= c <= 57:  # "0" to "9"
+                val = val * 10 + (c - 48)
+                digits += 1
+            elif c == 44 or c == 10:
+                if digits == 0:
+                    return -1
+                out[n] = -val if neg else val
+                n, val, digits, neg = n + 1, 0, 0, False
+            elif c == 45 and digits == 0 and not neg:  # "-"
+                neg = True
+            else:
+                return -1
+        if digits:
+            out[n] = -val if neg else val
+            n += 1
+        elif neg:
+            return -1
+        return n
+
+    def parser(buf):
+        out = np.empty(count_fields(buf), dtype=np.int64)
+        n = parse_ints(buf, out)
+        if n < 0:
+            return None
+        return out[:n]
+
+    return parser
+
+
+def parse_int_csv(raw: Union[str, bytes]) -> Union[np.ndarray, None]:
+    """Parse a CSV string of integers into a flat int64 array.
+
+    Returns None if Numba is not installed or if the string contains anything
+    other than integers separated by commas and newlines.
+    """
+    parser = _compile_int_parser()
+    if parser is None:
+        return None
+    return parser(_as_buffer(raw))
+
+
+@lru_cache(maxsize=None)
+def _compile_numeric_parser():
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(nogil=True)
+    def row_offsets(buf):
+        n = 0
+        for c in buf:
+            if c == 10:  # "\n"
+                n += 1
+        if len(buf) and buf[-1] != 10:
+            n += 1
+        offsets = np.empty(n + 1, dtype=np.int64)
+        offsets[0] = 0
+        i = 1
+        for pos in range(len(buf)):
+            if buf[pos] == 10:
+                offsets[i] = pos + 1
+                i += 1
+        if i == n:
+            offsets[n] = len(buf) + 1
+        return offsets
+
+    pow10 = _EXACT_POW10
+    max_mantissa = _MAX_EXACT_MANTISSA
+
+    @numba.njit(nogil=True)
+    def parse_field(buf, start, end):
+        # Returns (mantissa, exponent, negative, ok) so that integers stay exact.
+        mant, exp, exp_val, sig = 0, 0, 0, 0
+        neg, exp_neg, frac, in_exp, digits, exp_digits = False, False, False, False, 0, 0
+        pos = start
+        if pos < end and (buf[pos] == 45 or buf[pos] == 43):  # "-" or "+"
+            neg = buf[pos] == 45
+            pos += 1
+        while pos < end:
+            c = buf[pos]
+            if 48 <= c <= 57:  # "0" to "9"
+                if in_exp:
+                    exp_val = exp_val * 10 + (c - 48)
+                    exp_digits += 1
+                else:
+                    digits += 1
+                    if mant or c != 48:
+                        sig += 1
+                        if sig > 18:  # Would overflow int64
+                            return 0, 0, False, False
+                    mant = mant * 10 + (c - 48)
+                    if frac:
+                        exp -= 1
+            elif c == 46 and not frac and not in_exp:  # "."
+                frac = True
+            elif (c == 101 or c == 69) and digits and not in_exp:  # "e" or "E"
+                in_exp = True
+                if pos + 1 < end and (buf[pos + 1] == 45 or buf[pos + 1] == 43):
+                    exp_neg = buf[pos + 1] == 45
+                    pos += 1
+            else:
+                return 0, 0, False, False
+            pos += 1
+        if digits == 0 or (in_exp and exp_digits == 0) or exp_val > 400:
+            return 0, 0, False, False
+        exp += -exp_val if exp_neg else exp_val
+        return mant, exp, neg, True
+
+    @numba.njit(nogil=True)
+    def to_float(mant, exp, neg):
+        # Clinger's fast path: an exact mantissa times or divided by an exact
+        # power of ten is rounded once, so it is correctly rounded. Other
+        # numbers return NaN and the caller falls back to a full parser.
+        if mant == 0:
+            val = 0.0
+        elif mant > max_mantissa or exp < -22 or exp > 22:
+            return np.nan
+        elif exp < 0:
+            val = mant / pow10[-exp]
+        else:
+            val = mant * pow10[exp]
+        return -val if neg else val
+
+    # Not parallel=True: the loaders already parse batches on several reader
+    # threads, and the TBB threading layer hangs at exit when it is first started
+    # from a thread other than the main one.
+    @numba.njit(nogil=True)
+    def parse_rows(buf, offsets, is_float, col_index, ints, floats):
+        n_rows = len(offsets) - 1
+        n_cols = len(is_float)
+        for i in range(n_rows):
+            start, end = offsets[i], offsets[i + 1] - 1
+            j, field = 0, start
+            for pos in range(start, end + 1):
+                if pos < end and buf[pos] != 44:  # ","
+                    continue
+                if j == n_cols:
+                    return True
+                mant, exp, neg, ok = parse_field(buf, field, pos)
+                if not ok or (exp != 0 and not is_float[j]):
+                    return True
+                if not is_float[j]:
+                    ints[i, col_index[j]] = -mant if neg else mant
+                else:
+                    val = to_float(mant, exp, neg)
+                    if np.isnan(val):
+                        return True
+                    floats[i, col_index[j]] = val
+                j += 1
+                field = pos + 1
+            if j != n_cols:
+                return True
+        return False
+
+    def parser(buf, is_float):
+        offsets = row_offsets(buf)
+        n_rows = len(offsets) - 1
+        col_index = np.empty(len(is_float), dtype=np.int64)
+        col_index[is_float] = np.arange(is_float.sum())
+        col_index[~is_float] = np.arange((~is_float).sum())
+        ints = np.empty((n_rows, (~is_float).sum()), dtype=np.int64)
+        floats = np.empty((n_rows, is_float.sum()), dtype=np.float64)
+        if parse_rows(buf, offsets, is_float, col_index, ints, floats):
+            return None
+        return ints, floats
+
+    return parser
+
+
+def parse_numeric_csv(
+    raw: Union[str, bytes], is_float: np.ndarray
+) -> Union[Tuple[np.ndarray, np.ndarray], None]:
+    """Parse a CSV string of numbers into an int64 and a float64 matrix.
+
+    `is_float` is a boolean mask over the columns. Integer columns end up in
+    the first matrix and floating-point columns in the second, both in their
+    original order. The GIL is released while parsing, so that several reader
+    threads can parse at once. Floats are only converted where that is exact
+    after one rounding, i.e. for up to 15 or 16 significant digits and decimal
+    exponents within +/-22, so that they match Python's `float`.
+
+    Returns None if Numba is not installed, if a row does not have exactly one
+    number per column, or if a float needs a full parser.
+    """
+    parser = _compile_numeric_parser()
+    if parser is None:
+        return None
+    return parser(_as_buffer(raw), np.asarray(is_float, dtype=np.bool_))
@@ -5,8 +5,9 @@ import os
 import random
 import re
 import string
+from functools import lru_cache
 from os.path import join as pjoin
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
 from urllib.parse import urlparse
 
 if TYPE_CHECKING:
@@ -75,6 +76,37 @@ def download_from_s3(
 '''
 
 
+# Queries this process has seen installed and enabled, as (REST++ URL, graph, query name).
+# Lets loaders that are created over and over skip the round trip to list installed queries.
+_installed_queries = set()
+
+
+@lru_cache(maxsize=128)
+def _read_query_file(file_path: str, mtime: float = None) -> Tuple[str, str]:
+    """Read a query file. Returns the query name, which may contain placeholders,
+    and the query text. `mtime` is only part of the cache key, so that an edited
+    file is read again.
+    """
+    with open(file_path) as infile:
+        query = infile.read()
+    # The first line should be something like CREATE QUERY query_name (...
+    firstline = query.split("\n", 1)[0]
+    try:
+        query_name = re.search(r"QUERY (.+?)\(", firstline).group(1).strip()
+    except:
+        raise ValueError(
+            "Cannot parse the query file. It should start with CREATE QUERY ... "
+        )
+    return query_name, query
+
+
+def forget_installed_query(conn: "TigerGraphConnection", query_name: str) -> None:
+    """Remove a query from the cache of installed queries, so that the next
+    `install_query_file` for it checks its status on the server again.
+    """
+    _installed_queries.discard((conn.restppUrl, conn.graphname, query_name))
+
+
 def random_string(length: int = 1, chars: str = string.ascii_letters) -> str:
     return "".join(random.choice(chars) for _ in range(length))
 
@@ -114,33 +146,28 @@ def install_query_file(
     distributed: bool = False,
     force: bool = False,
 ) -> str:
-    # Read the first line of the file to get query name. The first line should be
-    # something like CREATE QUERY query_name (...
-    with open(file_path) as infile:
-        firstline = infile.readline()
-    try:
-        query_name = re.search(r"QUERY (.+?)\(", firstline).group(1).strip()
-    except:
-        raise ValueError(
-            "Cannot parse the query file. It should start with CREATE QUERY ... "
-        )
+    # Each version of a file is read and parsed only once.
+    query_name, query = _read_query_file(file_path, os.path.getmtime(file_path))
     # If a suffix is to be added to query name
     if replace and ("{QUERYSUFFIX}" in replace):
         query_name = query_name.replace("{QUERYSUFFIX}", replace["{QUERYSUFFIX}"])
+    cache_key = (conn.restppUrl, conn.graphname, query_name)
+    if not force and cache_key in _installed_queries:
+        return query_name
     # If query is already installed, skip unless force install.
     is_installed, is_enabled = is_query_installed(conn, query_name, return_status=True)
     if is_installed:
         if force or (not is_enabled):
-            query = "USE GRAPH {}\nDROP QUERY {}\n".format(conn.graphname, query_name)
-            resp = conn.gsql(query)
+            _installed_queries.discard(cache_key)
+            drop = "USE GRAPH {}\nDROP QUERY {}\n".format(conn.graphname, query_name)
+            resp = conn.gsql(drop)
             status = resp.splitlines()[-1]
             if "Failed" in status:
                 raise ConnectionError(status)
         else:
+            _installed_queries.add(cache_key)
             return query_name
     # Otherwise, install the query from file
-    with open(file_path) as infile:
-        query = infile.read()
     # Replace placeholders with actual content if given
     if replace:
         for placeholder in replace:
@@ -162,4 +189,5 @@ def install_query_file(
         raise ConnectionError(status)
     else:
         print(status)
+    _installed_queries.add(cache_key)
     return query_name
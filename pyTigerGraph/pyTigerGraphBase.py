@@ -7,10 +7,13 @@ A TigerGraphConnection object provides the HTTP(S) communication used by all oth
 import base64
 import json
 import sys
+import threading
 from typing import Union
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
 
@@ -125,6 +128,10 @@ class pyTigerGraphBase(object):
 
         self.Client = None
 
+        self._session = None
+        # Guards the creation of the session, since data loaders send requests from several threads.
+        self._session_lock = threading.Lock()
+
         self.tgCloud = tgCloud or gcp
         if "tgcloud" in self.netloc.lower():
             try: # if get request succeeds, using TG Cloud instance provisioned after 6/20/2022
@@ -169,6 +176,25 @@ class pyTigerGraphBase(object):
             # Endpoint might return string "false" rather than Boolean false
             raise TigerGraphException(res["message"], (res["code"] if "code" in res else None))
 
+    def _getSession(self) -> requests.Session:
+        """Returns the HTTP session used for REST requests, creating it on first use.
+
+        The session keeps a pool of connections alive, so that repeated requests (e.g. status
+        polling or data loader batches) do not pay for a new TCP/TLS handshake each time. Failed
+        connection attempts are retried with a short backoff; requests that were already sent are
+        not. The session is shared by all threads using this connection.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    retries = Retry(total=3, connect=3, read=False, backoff_factor=0.1)
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
     def _req(self, method: str, url: str, authMode: str = "token", headers: dict = None,
             data: Union[dict, list, str] = None, resKey: str = "results", skipCheck: bool = False,
             params: Union[dict, list, str] = None) -> Union[dict, list]:
@@ -218,14 +244,17 @@ class pyTigerGraphBase(object):
             _data = None
 
         if self.useCert is True or self.certPath is not None:
-            res = requests.request(method, url, headers=_headers, data=_data, params=params,
-                verify=False)
+            res = self._getSession().request(method, url, headers=_headers, data=_data,
+                params=params, verify=False)
         else:
-            res = requests.request(method, url, headers=_headers, data=_data, params=params)
+            res = self._getSession().request(method, url, headers=_headers, data=_data,
+                params=params)
 
         if res.status_code != 200:
             res.raise_for_status()
-        res = json.loads(res.text)
+        # Parse the raw bytes. `res.text` would first guess the charset of the whole body when the
+        # server does not declare one, which is slow for large responses.
+        res = json.loads(res.content)
         if not skipCheck:
             self._errorCheck(res)
         if not resKey:
@@ -1,13 +1,21 @@
+import inspect
 import io
 import unittest
-from queue import Queue
-from threading import Event
+from queue import Empty, Queue
+from threading import Event, Thread
+from types import SimpleNamespace
+from unittest.mock import MagicMock, mock_open, patch
 
+import numpy as np
 import pandas as pd
 import torch
+from numpy.testing import assert_array_equal
 from pandas.testing import assert_frame_equal
 from pyTigerGraph import TigerGraphConnection
-from pyTigerGraph.gds.dataloaders import BaseLoader
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraph.gds.dataloaders import (BaseLoader, EdgeNeighborLoader, GraphLoader,
+                                          NeighborLoader, VertexLoader, _BatchQueue,
+                                          _InlineThread)
 from torch.testing import assert_close as assert_close_torch
 from torch_geometric.data import Data as pygData
 from torch_geometric.data import HeteroData as pygHeteroData
@@ -168,6 +176,62 @@ class TestGDSBaseLoader(unittest.TestCase):
         data = data_q.get()
         self.assertIsNone(data)
 
+    def test_read_vertex_list(self):
+        read_task_q = Queue()
+        data_q = Queue(4)
+        exit_event = Event()
+        raw = "99,1 0 0 1 ,1,0,1\n8,1 0 0 1 ,1,1,1\n"
+        read_task_q.put(raw)
+        read_task_q.put(None)
+        self.loader._read_data(
+            exit_event,
+            read_task_q,
+            data_q,
+            "vertex",
+            "dataframe",
+            ["x"],
+            ["y"],
+            ["train_mask", "is_seed"],
+            {"x": "LIST:INT", "y": "INT", "train_mask": "BOOL", "is_seed": "BOOL"},
+        )
+        data = data_q.get()
+        truth = pd.read_csv(
+            io.StringIO(raw),
+            header=None,
+            names=["vid", "x", "y", "train_mask", "is_seed"],
+        )
+        assert_frame_equal(data, truth)
+        data = data_q.get()
+        self.assertIsNone(data)
+
+    def test_read_vertex_dtypes(self):
+        read_task_q = Queue()
+        data_q = Queue(4)
+        exit_event = Event()
+        # The schema decides the column types. Inferred, the UINT column would be int64.
+        raw = "99,1,0.5,Alex\n8,2,1.5,Bill\n"
+        read_task_q.put(raw)
+        read_task_q.put(None)
+        self.loader._read_data(
+            exit_event,
+            read_task_q,
+            data_q,
+            "vertex",
+            "dataframe",
+            ["count"],
+            ["score"],
+            ["name"],
+            {"count": "UINT", "score": "FLOAT", "name": "STRING"},
+        )
+        data = data_q.get()
+        self.assertDictEqual(
+            data.dtypes.astype(str).to_dict(),
+            {"vid": "int64", "count": "uint64", "score": "float64", "name": "object"},
+        )
+        self.assertListEqual(data["vid"].tolist(), [99, 8])
+        self.assertListEqual(data["count"].tolist(), [1, 2])
+        self.assertListEqual(data["name"].tolist(), ["Alex", "Bill"])
+
     def test_read_edge(self):
         read_task_q = Queue()
         data_q = Queue(4)
@@ -699,6 +763,442 @@ class TestGDSBaseLoader(unittest.TestCase):
         data = data_q.get()
         self.assertIsNone(data)
 
+    def test_parse_list_column(self):
+        col = pd.Series(["1 0 0 1 ", "2 3 4 5"])
+        assert_close_torch(
+            torch.tensor(self.loader._parse_list_column(col, "int")),
+            torch.tensor([[1, 0, 0, 1], [2, 3, 4, 5]]),
+        )
+        col = pd.Series(["0.5 1.5", "2 3"])
+        assert_close_torch(
+            torch.tensor(self.loader._parse_list_column(col, "double")),
+            torch.tensor([[0.5, 1.5], [2, 3]], dtype=torch.double),
+        )
+        col = pd.Series([], dtype="object")
+        self.assertTupleEqual(self.loader._parse_list_column(col, "int").shape, (0, 0))
+        # Ragged rows are not reshaped into rows of the first row's length.
+        col = pd.Series(["1 2 3", "4 5", "6 7 8 9"])
+        with self.assertRaises(TypeError):
+            self.loader._parse_list_column(col, "int")
+        arr = self.loader._parse_list_column(col, "double")
+        self.assertTupleEqual(arr.shape, (3, 4))
+        self.assertTrue(np.isnan(arr[1, 2:]).all())
+
+    def test_read_int_csv(self):
+        raw = "1,2\n3,4\n"
+        assert_frame_equal(
+            self.loader._read_int_csv(raw, ["source", "target"]),
+            pd.read_csv(io.StringIO(raw), header=None, names=["source", "target"]),
+        )
+        self.assertIsNone(self.loader._read_int_csv("1,2\n3,a\n", ["source", "target"]))
+        self.assertIsNone(self.loader._read_int_csv("1,2\n3\n", ["source", "target"]))
+        # Kafka messages are read as bytes.
+        assert_frame_equal(
+            self.loader._read_int_csv(raw.encode(), ["source", "target"]),
+            pd.read_csv(io.StringIO(raw), header=None, names=["source", "target"]),
+        )
+        self.assertIsNone(self.loader._read_int_csv(b"1,2\n3,a\n", ["source", "target"]))
+
+    def test_read_numeric_csv(self):
+        values = ["1.7976931348623157e308", "1e-320", "0.30000000000000004", "-0.5"]
+        raw = "".join("{},{}\n".format(i, v) for i, v in enumerate(values))
+        df = self.loader._read_csv(
+            raw, ["vid", "x"], dtype={"vid": "int64", "x": "float64"}, float_cols=["x"])
+        self.assertListEqual(df["vid"].tolist(), [0, 1, 2, 3])
+        self.assertListEqual(
+            [v.hex() for v in df["x"]], [float(v).hex() for v in values])
+
+    def test_frame_dtypes(self):
+        names = ["vid", "name", "day", "mask", "score"]
+        attr_types = {"name": "STRING", "day": "DATETIME", "mask": "BOOL", "score": "DOUBLE"}
+        raw = "1,123,2021-01-01 00:00:00,1,0.5\n2,Alex,2021-01-02 00:00:00,0,1\n"
+        df = self.loader._read_csv(raw, names, dtype=self.loader._frame_dtypes(names, attr_types, 1))
+        self.assertListEqual(df["name"].tolist(), ["123", "Alex"])
+        self.assertListEqual(df["day"].tolist(), ["2021-01-01 00:00:00", "2021-01-02 00:00:00"])
+        self.assertListEqual(
+            [str(t) for t in df.dtypes], ["int64", "object", "object", "int64", "float64"])
+
+    def test_split_by_type(self):
+        raw = "People,1,a\nCompany,2\nPeople,3,b\n"
+        self.assertDictEqual(
+            self.loader._split_by_type(raw),
+            {"People": "1,a\n3,b", "Company": "2"},
+        )
+
+    def test_csv_dtypes(self):
+        self.assertDictEqual(
+            self.loader._csv_dtypes(
+                ["vid", "x", "y", "mask", "name"],
+                {"x": "FLOAT", "y": "INT", "mask": "BOOL", "name": "STRING"}),
+            {"vid": "object", "x": "float64", "y": "int64", "mask": "int8", "name": "object"},
+        )
+
+    def test_add_self_loops(self):
+        edgelist = np.array([[0, 3, 1], [2, 1, 4]])
+        assert_array_equal(
+            self.loader._add_self_loops(edgelist),
+            np.array([[0, 3, 1, 0, 1, 2, 3, 4], [2, 1, 4, 0, 1, 2, 3, 4]]),
+        )
+
+    def test_check_feature_dtype(self):
+        self.assertIsNone(self.loader._check_feature_dtype(None, "PyG"))
+        self.assertEqual(self.loader._check_feature_dtype("bfloat16", "PyG"), "bfloat16")
+        self.assertEqual(self.loader._check_feature_dtype("int8", "spektral"), "int8")
+        with self.assertRaises(ValueError):
+            self.loader._check_feature_dtype("bfloat16", "spektral")
+        with self.assertRaises(ValueError):
+            self.loader._check_feature_dtype("flaot16", "dgl")
+
+    def test_quantize_int8(self):
+        arr = np.array([[0.5, -2.0, 0.0], [-1.0, 1.0, 0.0]], dtype=np.float32)
+        quantized, scale = self.loader._quantize_int8(arr)
+        self.assertEqual(quantized.dtype, np.int8)
+        assert_array_equal(quantized, np.array([[64, -127, 0], [-127, 64, 0]]))
+        assert_array_equal(scale, np.array([1 / 127, 2 / 127, 1], dtype=np.float32))
+
+    def test_batch_queue(self):
+        q = _BatchQueue(2)
+        with self.assertRaises(Empty):
+            q.get(block=False)
+        with self.assertRaises(Empty):
+            q.get(timeout=0.01)
+        producer = Thread(target=lambda: [q.put(i) for i in range(100)])
+        producer.start()
+        received = [q.get() for _ in range(100)]
+        producer.join()
+        self.assertListEqual(received, list(range(100)))
+        self.assertTrue(q.empty())
+        # Clearing a full queue unblocks a waiting producer.
+        q.put(0)
+        q.put(1)
+        producer = Thread(target=q.put, args=(2,))
+        producer.start()
+        q.clear()
+        producer.join()
+        self.assertEqual(q.get(block=False), 2)
+        self.assertTrue(q.empty())
+        # Several items go in with one call and come out in order.
+        q.put_many([3, 4, 5])
+        self.assertListEqual([q.get() for _ in range(3)], [3, 4, 5])
+        self.assertTrue(q.empty())
+
+    def test_numa_cpus(self):
+        for numa_node in (-1, 1.5, "0", True):
+            with self.assertRaisesRegex(ValueError, "numa_node"):
+                self.loader._numa_cpus(numa_node)
+        with patch("os.path.isdir", return_value=False):
+            with self.assertRaisesRegex(ValueError, "numa_node"):
+                self.loader._numa_cpus(0)
+        with patch("os.path.isdir", return_value=True), \
+                patch("builtins.open", mock_open(read_data="0-3,8\n")), \
+                patch("os.sched_getaffinity", return_value={2, 3, 8, 9}):
+            self.assertSetEqual(self.loader._numa_cpus(0), {2, 3, 8})
+        with patch("os.path.isdir", return_value=True), \
+                patch("builtins.open", mock_open(read_data="0-3\n")), \
+                patch("os.sched_getaffinity", return_value={4, 5}):
+            with self.assertRaisesRegex(ValueError, "numa_node"):
+                self.loader._numa_cpus(0)
+
+    def test_thread_failure(self):
+        loader = BaseLoader(self.conn)
+        loader._data_q = _BatchQueue()
+        loader._iterator = True
+        # The thread cannot be pinned to a CPU that does not exist.
+        loader._cpu_affinity = {1 << 20}
+        thread = loader._new_thread(target=loader._data_q.put, args=(1,))
+        thread.start()
+        thread.join()
+        with self.assertRaises(OSError):
+            next(loader)
+        self.assertFalse(loader._iterator)
+        # Errors raised by the target itself reach the consumer too.
+        loader._cpu_affinity = None
+        loader._iterator = True
+        thread = loader._new_thread(target=lambda: 1 / 0)
+        thread.start()
+        thread.join()
+        with self.assertRaises(ZeroDivisionError):
+            next(loader)
+
+    def test_run_query(self):
+        loader = BaseLoader(self.conn)
+        loader.query_name = "old_query"
+        with patch.object(loader._graph, "runInstalledQuery", create=True,
+                          side_effect=[TigerGraphException("Query not found"), ["ok"]]) as run, \
+                patch.object(loader, "_install_query", return_value="new_query") as install, \
+                patch("pyTigerGraph.gds.dataloaders.forget_installed_query") as forget:
+            self.assertListEqual(loader._run_query({"num_batches": 1}), ["ok"])
+        forget.assert_called_once_with(loader._graph, "old_query")
+        install.assert_called_once()
+        self.assertEqual(run.call_args[0][0], "new_query")
+        self.assertEqual(loader.query_name, "new_query")
+        # The query is only checked again on its first failure.
+        with patch.object(loader._graph, "runInstalledQuery", create=True,
+                          side_effect=TigerGraphException("Query not found")), \
+                patch.object(loader, "_install_query") as install:
+            with self.assertRaises(TigerGraphException):
+                loader._run_query({})
+        install.assert_not_called()
+
+    def test_count_batches(self):
+        loader = BaseLoader(self.conn)
+        with patch.object(loader, "_count_edges", return_value=2500) as count:
+            loader._set_num_batches(None, 1024, "edge", ["Cite"])
+            count.assert_not_called()
+            self.assertEqual(loader.num_batches, 3)
+            self.assertEqual(loader.num_batches, 3)
+            count.assert_called_once_with(["Cite"])
+        self.assertEqual(loader._payload["num_batches"], 3)
+        with patch.object(loader, "_count_vertices", return_value=10) as count:
+            loader._set_num_batches(None, 4, "vertex", ["Paper"], "train_mask")
+            self.assertEqual(loader.num_batches, 3)
+            count.assert_called_once_with(["Paper"], "train_mask")
+        loader._set_num_batches(5, None, "vertex", ["Paper"])
+        self.assertEqual(loader.num_batches, 5)
+        with self.assertRaises(NotImplementedError):
+            loader._set_num_batches(None, 1024, "edge", ["Cite"], "is_train")
+
+    def test_read_graph_contiguous_attrs(self):
+        read_task_q = Queue()
+        data_q = Queue(4)
+        exit_event = Event()
+        raw = (
+            "99,0.5,1,1\n8,1.5,0,0\n",
+            "99,8,2021,1\n8,99,2020,0\n",
+        )
+        read_task_q.put(raw)
+        read_task_q.put(None)
+        self.loader._read_data(
+            exit_event,
+            read_task_q,
+            data_q,
+            "graph",
+            "pyg",
+            ["x"],
+            ["y"],
+            ["is_seed"],
+            {"x": "DOUBLE", "y": "INT", "is_seed": "BOOL"},
+            ["time"],
+            ["y"],
+            [],
+            {"time": "INT", "y": "INT"},
+        )
+        data = data_q.get()
+        # Single columns are copied out of the parsed table instead of viewing it.
+        for key in ("x", "y", "is_seed", "edge_feat", "edge_label"):
+            tensor = data[key]
+            self.assertTrue(tensor.is_contiguous())
+            self.assertEqual(
+                tensor.untyped_storage().nbytes(), tensor.numel() * tensor.element_size()
+            )
+        assert_close_torch(data["x"], torch.tensor([0.5, 1.5], dtype=torch.double))
+        assert_close_torch(data["y"], torch.tensor([1, 0]))
+        assert_close_torch(data["edge_feat"], torch.tensor([2021, 2020]))
+        assert_close_torch(data["edge_label"], torch.tensor([1, 0]))
+
+    def test_pin_memory_default(self):
+        for loader_class in (NeighborLoader, GraphLoader, EdgeNeighborLoader):
+            self.assertIs(
+                inspect.signature(loader_class).parameters["pin_memory"].default, False
+            )
+        raw = ("99,1,1\n8,0,0\n", "99,8\n8,99\n")
+        # Even with a GPU, output is only pinned when asked for.
+        with patch("torch.cuda.is_available", return_value=True), \
+                patch.object(pygData, "pin_memory") as pin:
+            data = self.loader._parse_data(
+                raw, "graph", "pyg", ["x"], ["y"], [], {"x": "INT", "y": "INT"},
+                [], [], [], {}
+            )
+        pin.assert_not_called()
+        self.assertFalse(data["x"].is_pinned())
+
+    def test_count_edges(self):
+        loader = BaseLoader(self.conn)
+        counts = {"*": {"Cite": 10, "Follows": 5}, "Likes": 7}
+        with patch.object(loader._graph, "getEdgeCount", create=True,
+                          side_effect=lambda etype: counts[etype]) as count:
+            self.assertEqual(loader._count_edges(["Cite"]), 10)
+            count.assert_called_once_with("*")
+            # A type missing from the response is counted on its own.
+            self.assertEqual(loader._count_edges(["Cite", "Likes"]), 17)
+            count.assert_called_with("Likes")
+
+
+class TestGDSLoaderPipeline(unittest.TestCase):
+    """Iterate loaders end to end, with the database and Kafka mocked."""
+    schema = {
+        "VertexTypes": [{
+            "Name": "Paper",
+            "PrimaryId": {"AttributeName": "id", "AttributeType": {"Name": "INT"}},
+            "Attributes": [
+                {"AttributeName": "score", "AttributeType": {"Name": "DOUBLE"}},
+                {"AttributeName": "y", "AttributeType": {"Name": "INT"}},
+            ],
+        }],
+        "EdgeTypes": [{
+            "Name": "Cite",
+            "FromVertexTypeName": "Paper",
+            "ToVertexTypeName": "Paper",
+            "IsDirected": True,
+            "Config": {},
+            "Attributes": [
+                {"AttributeName": "weight", "AttributeType": {"Name": "DOUBLE"}},
+            ],
+        }],
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.conn = TigerGraphConnection(host="http://tigergraph", graphname="Cora")
+
+    def setUp(self):
+        for patcher in (
+            patch.object(self.conn, "getSchema", create=True, return_value=self.schema),
+            patch.object(GraphLoader, "_install_query", return_value="graph_loader"),
+            patch.object(VertexLoader, "_install_query", return_value="vertex_loader"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def batch(i: int, epoch: int = 0) -> dict:
+        # Batch i has vertices 2i and 2i + 1 and an edge between them. The label
+        # is the epoch, so that batches of different epochs can be told apart.
+        return {
+            "vertex_batch": "{},{}.5,{}\n{},{}.25,{}\n".format(2 * i, i, epoch, 2 * i + 1, i, epoch),
+            "edge_batch": "{},{},{}.75\n".format(2 * i, 2 * i + 1, i),
+        }
+
+    def mock_query(self, num_batches: int):
+        calls = []
+        def run(query_name, params=None, timeout=None, usePost=False):
+            calls.append(params["num_batches"])
+            return [self.batch(i, len(calls) - 1) for i in range(num_batches)]
+        return patch.object(self.conn, "runInstalledQuery", create=True, side_effect=run)
+
+    def graph_loader(self, num_batches: int, **kwargs) -> GraphLoader:
+        return GraphLoader(
+            self.conn,
+            v_in_feats=["score"],
+            v_out_labels=["y"],
+            e_in_feats=["weight"],
+            num_batches=num_batches,
+            output_format="PyG",
+            **kwargs
+        )
+
+    def check_batch(self, data: pygData, i: int, epoch: int = 0) -> None:
+        assert_close_torch(data["x"], torch.tensor([i + 0.5, i + 0.25], dtype=torch.double))
+        assert_close_torch(data["y"], torch.tensor([epoch, epoch]))
+        assert_close_torch(data["edge_index"], torch.tensor([[0], [1]]))
+        assert_close_torch(data["edge_feat"], torch.tensor([i + 0.75], dtype=torch.double))
+
+    def test_reader_threads(self):
+        with self.mock_query(6):
+            loader = self.graph_loader(6, reader_threads=3)
+            for epoch in range(2):
+                batches = list(loader)
+                self.assertEqual(len(batches), 6)
+                # Batches may come out of order with several readers.
+                batches.sort(key=lambda data: data["x"][0].item())
+                for i, data in enumerate(batches):
+                    self.check_batch(data, i, epoch)
+
+    def test_prefetch_depth(self):
+        with self.mock_query(3) as run:
+            loader = self.graph_loader(3, prefetch_depth=1)
+            for epoch in range(2):
+                batches = list(loader)
+                self.assertEqual(len(batches), 3)
+                for i, data in enumerate(batches):
+                    self.check_batch(data, i, epoch)
+            # The epoch after the last one was requested ahead of time.
+            self.assertEqual(run.call_count, 3)
+        loader._reset(theend=True)
+        self.assertIsNone(loader._rest_pool)
+
+    def test_inline_single_batch(self):
+        with self.mock_query(1) as run, \
+                patch("pyTigerGraph.gds.dataloaders.Thread") as thread:
+            loader = self.graph_loader(1)
+            data = loader.data
+            thread.assert_not_called()
+        self.check_batch(data, 0)
+        self.assertTrue(all(isinstance(r, _InlineThread) for r in loader._readers))
+        # The batch is kept, and iteration gives the same one.
+        self.assertIs(loader.data, data)
+        self.assertListEqual(list(loader), [data])
+        self.assertEqual(run.call_count, 1)
+        self.assertFalse(loader._inline)
+
+    def test_feature_dtype(self):
+        with self.mock_query(2):
+            loader = self.graph_loader(2, feature_dtype="float16")
+            batches = list(loader)
+        self.assertEqual(len(batches), 2)
+        for i, data in enumerate(batches):
+            self.assertEqual(data["x"].dtype, torch.float16)
+            self.assertEqual(data["edge_feat"].dtype, torch.float16)
+            # Labels are integers and keep their type.
+            self.assertEqual(data["y"].dtype, torch.int64)
+            assert_close_torch(data["x"], torch.tensor([i + 0.5, i + 0.25], dtype=torch.float16))
+        with self.mock_query(2):
+            loader = self.graph_loader(2, feature_dtype="int8")
+            batches = list(loader)
+        for i, data in enumerate(batches):
+            self.assertEqual(data["x"].dtype, torch.int8)
+            # Each column is scaled by its largest magnitude.
+            assert_close_torch(
+                data["x"].double() * data["x_scale"].double(),
+                torch.tensor([i + 0.5, i + 0.25], dtype=torch.double),
+                atol=(i + 0.5) / 127, rtol=0
+            )
+
+    def test_kafka_partitions(self):
+        partitions = {
+            0: [b"0,0.5,0\n1,0.25,0\n", b"2,1.5,0\n3,1.25,0\n"],
+            1: [b"4,2.5,0\n5,2.25,0\n", b"6,3.5,0\n7,3.25,0\n"],
+        }
+        consumers = []
+        def new_consumer(**config):
+            consumer = MagicMock()
+            consumer.partitions_for_topic.return_value = set(partitions)
+            consumer.assignment.return_value = set()
+            pending = []
+            def assign(tps):
+                tp = tps[0]
+                pending.extend(
+                    {tp: [SimpleNamespace(key=None, value=value)]}
+                    for value in partitions[tp.partition]
+                )
+            consumer.assign.side_effect = assign
+            consumer.poll.side_effect = lambda timeout: pending.pop(0) if pending else {}
+            consumers.append(consumer)
+            return consumer
+        admin = MagicMock()
+        admin.list_topics.return_value = []
+        admin.create_topics.return_value.to_object.return_value = {"topic_errors": [{"error_code": 0}]}
+        admin.describe_topics.return_value = [{"partitions": list(partitions)}]
+        with patch("kafka.KafkaConsumer", side_effect=new_consumer), \
+                patch("kafka.KafkaAdminClient", return_value=admin):
+            loader = VertexLoader(
+                self.conn,
+                attributes=["score", "y"],
+                num_batches=4,
+                kafka_address="kafka:9092",
+                kafka_num_partitions=2,
+                kafka_skip_produce=True,
+            )
+            batches = list(loader)
+        self.assertEqual(len(batches), 4)
+        # One consumer per partition.
+        self.assertEqual(len(consumers), 2)
+        assigned = sorted(c.assign.call_args[0][0][0].partition for c in consumers)
+        self.assertListEqual(assigned, [0, 1])
+        data = pd.concat(batches).sort_values("vid")
+        self.assertListEqual(data["vid"].tolist(), list(range(8)))
+        self.assertListEqual(data["score"].tolist(), [i // 2 + (0.5 if i % 2 == 0 else 0.25) for i in range(8)])
+
 
 if __name__ == "__main__":
     suite = unittest.TestSuite()
@@ -707,15 +1207,39 @@ if __name__ == "__main__":
     suite.addTest(TestGDSBaseLoader("test_validate_vertex_attributes"))
     suite.addTest(TestGDSBaseLoader("test_validate_edge_attributes"))
     suite.addTest(TestGDSBaseLoader("test_read_vertex"))
+    suite.addTest(TestGDSBaseLoader("test_read_vertex_list"))
+    suite.addTest(TestGDSBaseLoader("test_read_vertex_dtypes"))
     suite.addTest(TestGDSBaseLoader("test_read_edge"))
     suite.addTest(TestGDSBaseLoader("test_read_graph_out_df"))
     suite.addTest(TestGDSBaseLoader("test_read_graph_out_pyg"))
     suite.addTest(TestGDSBaseLoader("test_read_graph_out_dgl"))
     suite.addTest(TestGDSBaseLoader("test_read_graph_no_attr"))
+    suite.addTest(TestGDSBaseLoader("test_read_graph_contiguous_attrs"))
     suite.addTest(TestGDSBaseLoader("test_read_graph_no_edge"))
     suite.addTest(TestGDSBaseLoader("test_read_hetero_graph_out_pyg"))
     suite.addTest(TestGDSBaseLoader("test_read_hetero_graph_no_edge"))
     suite.addTest(TestGDSBaseLoader("test_read_hetero_graph_out_dgl"))
     suite.addTest(TestGDSBaseLoader("test_read_bool_label"))
+    suite.addTest(TestGDSBaseLoader("test_parse_list_column"))
+    suite.addTest(TestGDSBaseLoader("test_read_int_csv"))
+    suite.addTest(TestGDSBaseLoader("test_read_numeric_csv"))
+    suite.addTest(TestGDSBaseLoader("test_frame_dtypes"))
+    suite.addTest(TestGDSBaseLoader("test_split_by_type"))
+    suite.addTest(TestGDSBaseLoader("test_csv_dtypes"))
+    suite.addTest(TestGDSBaseLoader("test_add_self_loops"))
+    suite.addTest(TestGDSBaseLoader("test_check_feature_dtype"))
+    suite.addTest(TestGDSBaseLoader("test_quantize_int8"))
+    suite.addTest(TestGDSBaseLoader("test_batch_queue"))
+    suite.addTest(TestGDSBaseLoader("test_numa_cpus"))
+    suite.addTest(TestGDSBaseLoader("test_thread_failure"))
+    suite.addTest(TestGDSBaseLoader("test_run_query"))
+    suite.addTest(TestGDSBaseLoader("test_count_batches"))
+    suite.addTest(TestGDSBaseLoader("test_count_edges"))
+    suite.addTest(TestGDSBaseLoader("test_pin_memory_default"))
+    suite.addTest(TestGDSLoaderPipeline("test_reader_threads"))
+    suite.addTest(TestGDSLoaderPipeline("test_prefetch_depth"))
+    suite.addTest(TestGDSLoaderPipeline("test_inline_single_batch"))
+    suite.addTest(TestGDSLoaderPipeline("test_feature_dtype"))
+    suite.addTest(TestGDSLoaderPipeline("test_kafka_partitions"))
     runner = unittest.TextTestRunner(verbosity=2, failfast=True)
     runner.run(suite)
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+from pyTigerGraph.gds.kernels import parse_int_csv, parse_numeric_csv
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+@unittest.skipIf(numba is None, "numba is not installed")
+class TestGDSKernels(unittest.TestCase):
+    def test_parse_int_csv(self):
+        arr = parse_int_csv("1,2\n-3,40\n")
+        self.assertEqual(arr.dtype, np.int64)
+        self.assertListEqual(arr.tolist(), [1, 2, -3, 40])
+
+    def test_parse_int_csv_no_trailing_newline(self):
+        self.assertListEqual(parse_int_csv("1,2\n3,4").tolist(), [1, 2, 3, 4])
+
+    def test_parse_int_csv_invalid(self):
+        self.assertIsNone(parse_int_csv("1,2\n3,0.5\n"))
+        self.assertIsNone(parse_int_csv("1,,2\n"))
+        self.assertIsNone(parse_int_csv("1,-\n"))
+
+    def test_parse_numeric_csv(self):
+        ints, floats = parse_numeric_csv("1,0.5,3\n-2,-1.5e-3,4", [False, True, False])
+        self.assertEqual(ints.dtype, np.int64)
+        self.assertEqual(floats.dtype, np.float64)
+        self.assertListEqual(ints.tolist(), [[1, 3], [-2, 4]])
+        self.assertListEqual(floats.tolist(), [[0.5], [-0.0015]])
+
+    def test_parse_numeric_csv_invalid(self):
+        self.assertIsNone(parse_numeric_csv("1,0.5\n2\n", [False, True]))
+        self.assertIsNone(parse_numeric_csv("1.5,0.5\n", [False, True]))
+        self.assertIsNone(parse_numeric_csv("1,abc\n", [False, True]))
+
+    def test_parse_numeric_csv_rounding(self):
+        # Floats are either parsed exactly like `float` or left to a full parser.
+        rng = np.random.default_rng(0)
+        values = ["1.7976931348623157e308", "1e-320", "2.5e-310", "-0.0", "0.1", "9007199254740993"]
+        values += [repr(v) for v in rng.standard_normal(1000) * 10.0 ** rng.integers(-30, 30, 1000)]
+        values += ["{:.17g}".format(v) for v in rng.random(1000)]
+        values += ["{:.6f}".format(v) for v in rng.standard_normal(1000)]
+        parsed = 0
+        for value in values:
+            res = parse_numeric_csv(value, [True])
+            if res is not None:
+                self.assertEqual(res[1][0, 0].hex(), float(value).hex(), value)
+                parsed += 1
+        self.assertIsNone(parse_numeric_csv("1.7976931348623157e308", [True]))
+        self.assertIsNone(parse_numeric_csv("1e-320", [True]))
+        self.assertIsNone(parse_numeric_csv("2.5e-310", [True]))
+        # Short decimals take the fast path.
+        self.assertGreaterEqual(parsed, 1000)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(TestGDSKernels("test_parse_int_csv"))
+    suite.addTest(TestGDSKernels("test_parse_int_csv_no_trailing_newline"))
+    suite.addTest(TestGDSKernels("test_parse_int_csv_invalid"))
+    suite.addTest(TestGDSKernels("test_parse_numeric_csv"))
+    suite.addTest(TestGDSKernels("test_parse_numeric_csv_invalid"))
+    suite.addTest(TestGDSKernels("test_parse_numeric_csv_rounding"))
+    runner = unittest.TextTestRunner(verbosity=2, failfast=True)
+    runner.run(suite)
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
 from pyTigerGraph import TigerGraphConnection
 from pyTigerGraph.gds import utilities as utils
@@ -45,11 +46,37 @@ class TestGDSUtilsQuery(unittest.TestCase):
         )
 
 
+class TestGDSUtilsQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.conn = MagicMock(restppUrl="http://tigergraph:9000", graphname="Cora")
+        self.conn.gsql.return_value = "Query installation finished."
+        utils._installed_queries.clear()
+
+    def test_forget_installed_query(self):
+        with patch.object(utils, "is_query_installed", return_value=(False, None)) as check:
+            resp = utils.install_query_file(
+                self.conn, "./tests/fixtures/create_query_simple.gsql"
+            )
+            self.assertEqual(resp, "simple_query")
+            self.assertEqual(self.conn.gsql.call_count, 1)
+            # Cached. The server is not asked again.
+            utils.install_query_file(self.conn, "./tests/fixtures/create_query_simple.gsql")
+            self.assertEqual(check.call_count, 1)
+            self.assertEqual(self.conn.gsql.call_count, 1)
+            # Evicted. The status is checked again and the query reinstalled.
+            utils.forget_installed_query(self.conn, "simple_query")
+            utils.install_query_file(self.conn, "./tests/fixtures/create_query_simple.gsql")
+            self.assertEqual(check.call_count, 2)
+            self.assertEqual(self.conn.gsql.call_count, 2)
+        self.assertIn("CREATE QUERY simple_query", self.conn.gsql.call_args[0][0])
+
+
 if __name__ == "__main__":
     suite = unittest.TestSuite()
     suite.addTest(TestGDSUtilsQuery("test_is_query_installed"))
     suite.addTest(TestGDSUtilsQuery("test_install_query_file"))
     suite.addTest(TestGDSUtilsQuery("test_install_exist_query"))
     suite.addTest(TestGDSUtilsQuery("test_install_query_template"))
+    suite.addTest(TestGDSUtilsQueryCache("test_forget_installed_query"))
     runner = unittest.TextTestRunner(verbosity=2, failfast=True)
     runner.run(suite)